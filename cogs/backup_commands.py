@@ -280,13 +280,13 @@ class BackupChatCommands(commands.Cog):
         # Show selection
         embed = discord.Embed(
             title="📦 Select Backup to Restore",
-            description="⚠️ **Warning:** Restoring will delete all current channels and roles!",
+            description="⚠️ **Warning:** Restoring will delete any channels and roles not in the backup!",
             color=0xFF0000,
             timestamp=datetime.utcnow()
         )
         embed.add_field(
             name="⚠️ This Action Will:",
-            value="• Delete ALL current channels\n• Delete ALL current roles\n• Reset server settings\n• **Cannot be undone**",
+            value="• Delete channels not in the backup\n• Delete roles not in the backup\n• Overwrite matching channels and roles\n• Reset server settings\n• **Cannot be undone**",
             inline=False
         )
         
@@ -316,7 +316,7 @@ class BackupChatCommands(commands.Cog):
         )
         confirm_embed.add_field(
             name="⚠️ This Will DELETE:",
-            value="• All current channels\n• All current roles\n• Current server settings",
+            value="• Channels not in the backup\n• Roles not in the backup\n• Current server settings",
             inline=False
         )
         confirm_embed.add_field(
@@ -10,12 +10,52 @@ import aiohttp
 import os
 import base64
 import hashlib
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, Callable, Dict, List, Any, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 
 
+# Discord JSON error codes for "maximum number of X reached"
+DISCORD_LIMIT_CODES = {
+    30005: "Role",
+    30008: "Emoji",
+    30013: "Channel",
+    30018: "Animated emoji",
+    30039: "Sticker",
+}
+
+# Codes that end each restore loop early; everything else only skips the current item
+EMOJI_LIMIT_CODES = {30008}
+ANIMATED_EMOJI_LIMIT_CODES = {30018}
+STICKER_LIMIT_CODES = {30039}
+
+
+def _fast_rmtree(path: str, errors: List[str]):
+    """
+    Recursively delete a directory, using os.scandir's cached entry types instead of a stat per file.
+    Failures are appended to errors as "path: error" and the walk carries on.
+    """
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    _fast_rmtree(entry.path, errors)
+                else:
+                    try:
+                        os.unlink(entry.path)
+                    except OSError as e:
+                        errors.append(f"{entry.path}: {e}")
+    except OSError as e:
+        errors.append(f"{path}: {e}")
+        return
+    
+    try:
+        os.rmdir(path)
+    except OSError as e:
+        errors.append(f"{path}: {e}")
+
+
 class RateLimitBucket:
     """Track rate limits for different API endpoints"""
     
@@ -646,7 +686,8 @@ class ComprehensiveBackupSystem:
                     # Keep if ID matches backup OR name matches backup
                     if channel.id in backup_channel_ids or channel.id in backup_category_ids:
                         continue
-                    if channel.name.lower() in backup_channel_names or channel.name.lower() in backup_category_names:
+                    channel_name_lc = channel.name.lower()
+                    if channel_name_lc in backup_channel_names or channel_name_lc in backup_category_names:
                         continue
                     try:
                         await self.api.execute_with_delay('channel_edit', channel.delete(reason="Backup restore"))
@@ -703,7 +744,10 @@ class ComprehensiveBackupSystem:
             # Build lookup maps for existing roles
             existing_roles_by_id = {r.id: r for r in guild.roles}
             existing_roles_by_name = {r.name.lower(): r for r in guild.roles}
-            
+
+            # Backup roles whose ID still exists are updates; the rest fall back to a name match
+            matched_role_ids = backup_role_ids & existing_roles_by_id.keys()
+
             for i, role_data in enumerate(roles_to_restore):
                 role_name = role_data.get('name', 'Restored Role')
                 backup_role_id = role_data.get('id')
@@ -726,11 +770,10 @@ class ComprehensiveBackupSystem:
                         role_info += f" ({color_hex})"
                     
                     # Check if role already exists - by ID first, then by name
-                    existing_role = None
-                    if backup_role_id and backup_role_id in existing_roles_by_id:
+                    if backup_role_id in matched_role_ids:
                         existing_role = existing_roles_by_id[backup_role_id]
-                    elif role_name.lower() in existing_roles_by_name:
-                        existing_role = existing_roles_by_name[role_name.lower()]
+                    else:
+                        existing_role = existing_roles_by_name.get(role_name.lower())
                     
                     if existing_role and not existing_role.is_bot_managed() and not existing_role.is_default():
                         # Update existing role
@@ -748,10 +791,12 @@ class ComprehensiveBackupSystem:
                         if error:
                             print(f"[RESTORE] Error updating role {role_name}: {error}")
                             skipped_roles += 1
-                            if progress_callback and "Missing Permissions" in str(error):
-                                await progress_callback(f"⚠️ Skip: {role_name} (no permission)")
-                            elif progress_callback and "timed out" in str(error).lower():
-                                await progress_callback(f"⚠️ Timeout: {role_name}")
+                            if progress_callback:
+                                # execute_with_delay already hands back the error as a str
+                                if "Missing Permissions" in error:
+                                    await progress_callback(f"⚠️ Skip: {role_name} (no permission)")
+                                elif "timed out" in error.lower():
+                                    await progress_callback(f"⚠️ Timeout: {role_name}")
                         else:
                             role_id_map[backup_role_id] = existing_role
                             restored_roles += 1
@@ -774,10 +819,11 @@ class ComprehensiveBackupSystem:
                         if error:
                             print(f"[RESTORE] Error creating role {role_name}: {error}")
                             skipped_roles += 1
-                            if progress_callback and "Missing Permissions" in str(error):
-                                await progress_callback(f"⚠️ Skip: {role_name} (no permission)")
-                            elif progress_callback and "timed out" in str(error).lower():
-                                await progress_callback(f"⚠️ Timeout: {role_name}")
+                            if progress_callback:
+                                if "Missing Permissions" in error:
+                                    await progress_callback(f"⚠️ Skip: {role_name} (no permission)")
+                                elif "timed out" in error.lower():
+                                    await progress_callback(f"⚠️ Timeout: {role_name}")
                         elif new_role:
                             role_id_map[backup_role_id] = new_role
                             restored_roles += 1
@@ -786,11 +832,15 @@ class ComprehensiveBackupSystem:
                             
                             # Restore role icon if exists (only for boosted servers)
                             icon_path = role_data.get('icon_path')
-                            if icon_path and os.path.exists(icon_path) and guild.premium_tier >= 2:
+                            if icon_path and guild.premium_tier >= 2:
+                                try:
+                                    icon_size = os.path.getsize(icon_path)
+                                except OSError:
+                                    icon_size = None  # Icon file missing - skip quietly
                                 try:
-                                    with open(icon_path, 'rb') as f:
-                                        icon_data = f.read()
-                                    if len(icon_data) < 256 * 1024:  # 256KB limit
+                                    if icon_size is not None and icon_size < 256 * 1024:  # 256KB limit
+                                        with open(icon_path, 'rb') as f:
+                                            icon_data = f.read()
                                         await self.api.execute_with_delay('role_edit', new_role.edit(icon=icon_data))
                                 except Exception as icon_err:
                                     print(f"[RESTORE] Role icon failed: {icon_err}")
@@ -801,7 +851,7 @@ class ComprehensiveBackupSystem:
                     print(f"[RESTORE] Failed to restore role {role_name}: {e}")
                     skipped_roles += 1
                     if progress_callback:
-                        err_short = str(e)[:50] if len(str(e)) > 50 else str(e)
+                        err_short = str(e)[:50]
                         await progress_callback(f"❌ Error: {role_name} - {err_short}")
                     continue  # Don't get stuck, move to next role
             
@@ -812,9 +862,6 @@ class ComprehensiveBackupSystem:
                     summary += f", {skipped_roles} skipped"
                 await progress_callback(summary)
             
-            # Refresh existing channels after role changes
-            existing_channels = {c.name.lower(): c for c in guild.channels}
-            
             # === STEP 4: RESTORE CATEGORIES ===
             categories = backup_data.get('categories', [])
             total_cats = len(categories)
@@ -841,8 +888,8 @@ class ComprehensiveBackupSystem:
                         ch = existing_channels_by_id[backup_cat_id]
                         if isinstance(ch, discord.CategoryChannel):
                             existing_cat = ch
-                    if not existing_cat and cat_name.lower() in existing_channels_by_name:
-                        ch = existing_channels_by_name[cat_name.lower()]
+                    if not existing_cat:
+                        ch = existing_channels_by_name.get(cat_name.lower())
                         if isinstance(ch, discord.CategoryChannel):
                             existing_cat = ch
                     
@@ -940,9 +987,9 @@ class ComprehensiveBackupSystem:
                         ch = existing_channels_by_id[backup_channel_id]
                         if not isinstance(ch, discord.CategoryChannel):
                             existing_ch = ch
-                    if not existing_ch and channel_name.lower() in existing_channels_by_name:
-                        ch = existing_channels_by_name[channel_name.lower()]
-                        if not isinstance(ch, discord.CategoryChannel):
+                    if not existing_ch:
+                        ch = existing_channels_by_name.get(channel_name.lower())
+                        if ch is not None and not isinstance(ch, discord.CategoryChannel):
                             existing_ch = ch
                     
                     if existing_ch:
@@ -1077,25 +1124,34 @@ class ComprehensiveBackupSystem:
                 else:
                     restored_emojis = 0
                     skipped_emojis = 0
+                    animated_limit_hit = False
                     
                     for emoji_data in emojis:
                         if restored_emojis >= available_slots:
                             skipped_emojis += 1
                             continue
+                        if animated_limit_hit and emoji_data.get('animated'):
+                            skipped_emojis += 1
+                            continue
                         
                         try:
                             image_path = emoji_data.get('image_path')
                             emoji_name = emoji_data.get('name', 'restored_emoji')
                             
-                            if image_path and os.path.exists(image_path):
-                                with open(image_path, 'rb') as f:
-                                    image_data = f.read()
-                                
-                                # Check file size (256KB limit)
-                                if len(image_data) > 256 * 1024:
+                            if image_path:
+                                # Check file size (256KB limit) before reading it into memory
+                                try:
+                                    image_size = os.path.getsize(image_path)
+                                except OSError:
                                     skipped_emojis += 1
                                     continue
-                                
+                                if image_size > 256 * 1024:
+                                    skipped_emojis += 1
+                                    continue
+
+                                with open(image_path, 'rb') as f:
+                                    image_data = f.read()
+
                                 # Map role restrictions
                                 roles = []
                                 for old_role_id in emoji_data.get('role_ids', []):
@@ -1121,10 +1177,15 @@ class ComprehensiveBackupSystem:
                             else:
                                 skipped_emojis += 1
                         except discord.HTTPException as e:
-                            if e.code == 30008:  # Max emojis reached
+                            if e.code in EMOJI_LIMIT_CODES:
                                 if progress_callback:
-                                    await progress_callback(f"⚠️ Emoji limit reached, skipping remaining...")
+                                    await progress_callback(f"⚠️ {DISCORD_LIMIT_CODES[e.code]} limit reached, skipping remaining...")
                                 break
+                            if e.code in ANIMATED_EMOJI_LIMIT_CODES and not animated_limit_hit:
+                                # Static slots may still be free, so only the animated emojis stop here
+                                animated_limit_hit = True
+                                if progress_callback:
+                                    await progress_callback(f"⚠️ {DISCORD_LIMIT_CODES[e.code]} limit reached, skipping remaining animated emojis...")
                             skipped_emojis += 1
                         except Exception as e:
                             skipped_emojis += 1
@@ -1157,7 +1218,8 @@ class ComprehensiveBackupSystem:
                         
                         try:
                             image_path = sticker_data.get('image_path')
-                            if image_path and os.path.exists(image_path):
+                            # Check file size (512KB sticker limit) before opening it
+                            if image_path and os.path.exists(image_path) and os.path.getsize(image_path) <= 512 * 1024:
                                 with open(image_path, 'rb') as f:
                                     file = discord.File(f, filename=f"{sticker_data.get('name', 'sticker')}.png")
                                 
@@ -1174,7 +1236,9 @@ class ComprehensiveBackupSystem:
                                 if new_sticker:
                                     restored_stickers += 1
                         except discord.HTTPException as e:
-                            if e.code == 30039:  # Max stickers reached
+                            if e.code in STICKER_LIMIT_CODES:
+                                if progress_callback:
+                                    await progress_callback(f"⚠️ {DISCORD_LIMIT_CODES[e.code]} limit reached, skipping remaining...")
                                 break
                         except Exception as e:
                             print(f"[RESTORE] Failed to restore sticker {sticker_data.get('name')}: {e}")
@@ -1205,26 +1269,28 @@ class ComprehensiveBackupSystem:
                     edit_kwargs['afk_channel'] = channel_id_map[backup_data['afk_channel_id']]
                     edit_kwargs['afk_timeout'] = backup_data.get('afk_timeout', 300)
                 
-                if edit_kwargs:
-                    await self.api.execute_with_delay('channel_edit', guild.edit(**edit_kwargs))
-                    if progress_callback:
-                        await progress_callback("⚙️ Server settings updated")
-                
-                # Restore server icon
+                # Server icon and banner (banner requires boost level 2) go in the same edit
+                restored_assets = []
                 icon_path = backup_data.get('icon_path')
                 if icon_path and os.path.exists(icon_path):
                     with open(icon_path, 'rb') as f:
-                        await self.api.execute_with_delay('channel_edit', guild.edit(icon=f.read()))
-                    if progress_callback:
-                        await progress_callback("🖼️ Server icon restored")
+                        edit_kwargs['icon'] = f.read()
+                    restored_assets.append("icon")
                 
-                # Restore server banner (requires boost level 2)
                 banner_path = backup_data.get('banner_path')
                 if banner_path and os.path.exists(banner_path) and guild.premium_tier >= 2:
                     with open(banner_path, 'rb') as f:
-                        await self.api.execute_with_delay('channel_edit', guild.edit(banner=f.read()))
-                    if progress_callback:
-                        await progress_callback("🖼️ Server banner restored")
+                        edit_kwargs['banner'] = f.read()
+                    restored_assets.append("banner")
+                
+                if edit_kwargs:
+                    result, error = await self.api.execute_with_delay('channel_edit', guild.edit(**edit_kwargs))
+                    if error:
+                        print(f"[RESTORE] Error updating server settings: {error}")
+                    elif progress_callback:
+                        await progress_callback("⚙️ Server settings updated")
+                        if restored_assets:
+                            await progress_callback(f"🖼️ Server {' and '.join(restored_assets)} restored")
                         
             except Exception as e:
                 print(f"[RESTORE] Failed to restore server settings: {e}")
@@ -1299,13 +1365,9 @@ class ComprehensiveBackupSystem:
             # Update the JSON file with new ID
             json_path = os.path.join(new_path, "backup.json")
             if os.path.exists(json_path):
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                data['backup_id'] = new_backup_id
-                data['imported_from'] = backup_id
-                data['imported_at'] = datetime.utcnow().isoformat()
-                with open(json_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2)
+                imported_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+                # Large backups take a while to reparse - keep that off the event loop
+                await asyncio.to_thread(self._patch_backup_json, json_path, new_backup_id, backup_id, imported_at)
         
         # Save to database for target guild
         original_name = backup_data.get('guild_name', 'Unknown')
@@ -1318,23 +1380,37 @@ class ComprehensiveBackupSystem:
         
         return True, f"Backup imported successfully! New ID: {new_backup_id}"
     
-    def list_backups(self, guild_id: int) -> List[dict]:
+    def _patch_backup_json(self, json_path: str, new_backup_id: str, imported_from: str, imported_at: str):
+        """Give an imported copy of backup.json its new ID and import metadata"""
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data['backup_id'] = new_backup_id
+        data['imported_from'] = imported_from
+        data['imported_at'] = imported_at
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+    
+    async def list_backups(self, guild_id: int) -> List[dict]:
         """List all backups for a guild"""
-        return self.db.list_comprehensive_backups(guild_id)
+        return await asyncio.to_thread(self.db.list_comprehensive_backups, guild_id)
     
-    def get_backup_info(self, guild_id: int, backup_id: str) -> Optional[dict]:
+    async def get_backup_info(self, guild_id: int, backup_id: str) -> Optional[dict]:
         """Get detailed info about a backup"""
-        return self.db.get_comprehensive_backup(guild_id, backup_id)
+        return await asyncio.to_thread(self.db.get_comprehensive_backup, guild_id, backup_id)
     
-    def delete_backup(self, guild_id: int, backup_id: str) -> bool:
+    async def delete_backup(self, guild_id: int, backup_id: str) -> bool:
         """Delete a backup and its files"""
         # Delete from database
-        success = self.db.delete_comprehensive_backup(guild_id, backup_id)
+        success = await asyncio.to_thread(self.db.delete_comprehensive_backup, guild_id, backup_id)
         
-        # Delete files
-        backup_path = self._get_backup_path(backup_id)
-        if os.path.exists(backup_path):
-            import shutil
-            shutil.rmtree(backup_path, ignore_errors=True)
+        # Delete files off the event loop - comprehensive backups can hold thousands of files
+        backup_path = os.path.join(self.backup_dir, backup_id)
+        if os.path.isdir(backup_path):
+            errors = []
+            await asyncio.to_thread(_fast_rmtree, backup_path, errors)
+            if errors:
+                print(f"[BACKUP] Failed to delete {len(errors)} path(s) for backup {backup_id}:")
+                for error in errors:
+                    print(f"  {error}")
         
         return success
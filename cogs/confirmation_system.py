@@ -6,9 +6,64 @@ Handles confirmation dialogs for destructive actions
 import discord
 from discord.ui import Button, View
 import asyncio
-from datetime import datetime
+import functools
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
 from utils.colors import ANSIColors
 
+# Static frame of the terminal confirmation prompt
+_CONFIRM_HEADER = f"""
+{ANSIColors.RED}{'━' * 46}{ANSIColors.RESET}
+{ANSIColors.RED}║{ANSIColors.RESET}            {ANSIColors.BOLD}CONFIRMATION REQUIRED{ANSIColors.RESET}           {ANSIColors.RED}║{ANSIColors.RESET}
+{ANSIColors.RED}{'━' * 46}{ANSIColors.RESET}
+
+"""
+
+_CONFIRM_FOOTER = f"""
+{ANSIColors.BRIGHT_WHITE}Type 'confirm' to proceed or 'cancel' to abort{ANSIColors.RESET}
+{ANSIColors.BRIGHT_BLACK}This confirmation will timeout in 60 seconds{ANSIColors.RESET}
+"""
+
+# Whole prompt for the common no-details/no-warning case, only the action varies
+_EMPTY_CONFIRM_TEMPLATE = (
+    _CONFIRM_HEADER
+    + f"{ANSIColors.BRIGHT_RED}Action:{ANSIColors.RESET} {ANSIColors.BRIGHT_WHITE}{{action}}{ANSIColors.RESET}\n"
+    + _CONFIRM_FOOTER
+)
+
+# Terminal replies accepted for a pending confirmation
+CONFIRM_WORDS = frozenset({'confirm', 'yes', 'y', 'ok'})
+CANCEL_WORDS = frozenset({'cancel', 'no', 'n', 'abort'})
+
+_UTC = timezone.utc
+
+def _confirm_embed(title, description, warning, timeout):
+    """Build the embed shown by ConfirmationSystem.confirm_action"""
+    embed = discord.Embed(
+        title=f"⚠️ {title}",
+        description=description,
+        color=0xFF0000,
+        timestamp=datetime.now(_UTC)
+    )
+    
+    if warning:
+        embed.add_field(
+            name="⚠️ Warning",
+            value=warning,
+            inline=False
+        )
+    
+    embed.add_field(
+        name="Confirmation Required",
+        value="Click **✓ Confirm** to proceed or **✗ Cancel** to abort.",
+        inline=False
+    )
+    
+    embed.set_footer(text=f"Timeout: {timeout}s")
+    return embed
+
 class ConfirmationView(View):
     """Confirmation button view"""
     
@@ -17,38 +72,59 @@ class ConfirmationView(View):
         self.author_id = author_id
         self.confirmed = None
         self.message = None
+        # Set once the view resolves (confirm, cancel or timeout)
+        self.done = asyncio.Event()
+    
+    async def _reject_if_not_author(self, interaction: discord.Interaction) -> bool:
+        """Reply ephemerally and return True if someone other than the author pressed a button"""
+        if interaction.user.id == self.author_id:
+            return False
+        await interaction.response.send_message("❌ Only the command author can interact.", ephemeral=True)
+        return True
     
     @discord.ui.button(label="✓ Confirm", style=discord.ButtonStyle.danger)
     async def confirm_button(self, interaction: discord.Interaction, button: Button):
         """Confirm action"""
-        if interaction.user.id != self.author_id:
-            await interaction.response.send_message("❌ Only the command author can confirm.", ephemeral=True)
+        if await self._reject_if_not_author(interaction):
             return
         
         self.confirmed = True
+        self.done.set()
         self.stop()
         await interaction.response.edit_message(content="✓ **Confirmed!** Processing...", view=None)
     
     @discord.ui.button(label="✗ Cancel", style=discord.ButtonStyle.secondary)
     async def cancel_button(self, interaction: discord.Interaction, button: Button):
         """Cancel action"""
-        if interaction.user.id != self.author_id:
-            await interaction.response.send_message("❌ Only the command author can cancel.", ephemeral=True)
+        if await self._reject_if_not_author(interaction):
             return
         
         self.confirmed = False
+        self.done.set()
         self.stop()
         await interaction.response.edit_message(content="✗ **Cancelled.** No changes made.", view=None)
     
     async def on_timeout(self):
         """Handle timeout"""
         self.confirmed = False
+        self.done.set()
         if self.message:
             try:
                 await self.message.edit(content="⏱️ **Confirmation timed out.** No changes made.", view=None)
             except:
                 pass
 
+@dataclass(slots=True)
+class PendingConfirmation:
+    """Terminal confirmation waiting for a 'confirm'/'cancel' reply"""
+    action: str
+    details: dict
+    warning: Optional[str] = None
+    
+    def get(self, key, default=None):
+        """dict-style access - other panels still store plain dicts in pending_confirmation"""
+        return getattr(self, key, default)
+
 class ConfirmationSystem:
     """Handles all confirmation dialogs"""
     
@@ -59,27 +135,7 @@ class ConfirmationSystem:
         
         Returns: True if confirmed, False if cancelled/timeout
         """
-        embed = discord.Embed(
-            title=f"⚠️ {title}",
-            description=description,
-            color=0xFF0000,
-            timestamp=datetime.utcnow()
-        )
-        
-        if warning:
-            embed.add_field(
-                name="⚠️ Warning",
-                value=warning,
-                inline=False
-            )
-        
-        embed.add_field(
-            name="Confirmation Required",
-            value="Click **✓ Confirm** to proceed or **✗ Cancel** to abort.",
-            inline=False
-        )
-        
-        embed.set_footer(text=f"Timeout: {timeout}s")
+        embed = _confirm_embed(title, description, warning, timeout)
         
         # Create view
         view = ConfirmationView(ctx.author.id, timeout=timeout)
@@ -88,10 +144,15 @@ class ConfirmationSystem:
         message = await ctx.send(embed=embed, view=view)
         view.message = message
         
-        # Wait for response
-        await view.wait()
+        # Wait for response - the view's own timeout normally resolves this first
+        try:
+            await asyncio.wait_for(view.done.wait(), timeout=timeout + 5)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            view.stop()
         
-        return view.confirmed == True
+        return view.confirmed is True
     
     @staticmethod
     async def confirm_terminal_action(session, action_name, details, warning=None):
@@ -101,37 +162,23 @@ class ConfirmationSystem:
         Returns: True if confirmed, False if cancelled
         """
         # Store confirmation request
-        session.pending_confirmation = {
-            'action': action_name,
-            'details': details,
-            'warning': warning
-        }
+        session.pending_confirmation = PendingConfirmation(action_name, details, warning)
         
-        output = f"""
-{ANSIColors.RED}{'━' * 46}{ANSIColors.RESET}
-{ANSIColors.RED}║{ANSIColors.RESET}            {ANSIColors.BOLD}CONFIRMATION REQUIRED{ANSIColors.RESET}           {ANSIColors.RED}║{ANSIColors.RESET}
-{ANSIColors.RED}{'━' * 46}{ANSIColors.RESET}
-
-{ANSIColors.BRIGHT_RED}Action:{ANSIColors.RESET} {ANSIColors.BRIGHT_WHITE}{action_name}{ANSIColors.RESET}
-"""
+        if not details and not warning:
+            return _EMPTY_CONFIRM_TEMPLATE.format(action=action_name)
+        
+        parts = [_CONFIRM_HEADER, f"{ANSIColors.BRIGHT_RED}Action:{ANSIColors.RESET} {ANSIColors.BRIGHT_WHITE}{action_name}{ANSIColors.RESET}\n"]
         
         if details:
-            output += f"\n{ANSIColors.BRIGHT_CYAN}Details:{ANSIColors.RESET}\n"
+            parts.append(f"\n{ANSIColors.BRIGHT_CYAN}Details:{ANSIColors.RESET}\n")
             for key, value in details.items():
-                output += f"  {ANSIColors.BRIGHT_BLACK}►{ANSIColors.RESET} {key}: {ANSIColors.BRIGHT_WHITE}{value}{ANSIColors.RESET}\n"
+                parts.append(f"  {ANSIColors.BRIGHT_BLACK}►{ANSIColors.RESET} {key}: {ANSIColors.BRIGHT_WHITE}{value}{ANSIColors.RESET}\n")
         
         if warning:
-            output += f"""
-{ANSIColors.YELLOW}⚠️  Warning:{ANSIColors.RESET}
-{warning}
-"""
-        
-        output += f"""
-{ANSIColors.BRIGHT_WHITE}Type 'confirm' to proceed or 'cancel' to abort{ANSIColors.RESET}
-{ANSIColors.BRIGHT_BLACK}This confirmation will timeout in 60 seconds{ANSIColors.RESET}
-"""
+            parts.append(f"\n{ANSIColors.YELLOW}⚠️  Warning:{ANSIColors.RESET}\n{warning}\n")
         
-        return output
+        parts.append(_CONFIRM_FOOTER)
+        return "".join(parts)
     
     @staticmethod
     def handle_terminal_confirmation(session, user_input):
@@ -145,155 +192,419 @@ class ConfirmationSystem:
         
         command_lower = user_input.lower().strip()
         
-        if command_lower == "confirm":
+        if command_lower in CONFIRM_WORDS:
             action_data = session.pending_confirmation
             session.pending_confirmation = None
             return True, action_data
-        elif command_lower == "cancel":
+        elif command_lower in CANCEL_WORDS:
             session.pending_confirmation = None
             return False, None
         else:
             # Still waiting for confirmation
             return None, session.pending_confirmation
 
+def _fast_perms(value):
+    """Build a Permissions straight from its bitfield, skipping __init__'s argument handling"""
+    perms = discord.Permissions.__new__(discord.Permissions)
+    perms.value = value
+    return perms
+
+@functools.lru_cache(maxsize=1024)
+def _make_overwrite(allow, deny):
+    """Build a PermissionOverwrite - most channels share a handful of allow/deny pairs"""
+    return discord.PermissionOverwrite.from_pair(_fast_perms(int(allow)), _fast_perms(int(deny)))
+
+@functools.lru_cache(maxsize=256)
+def _make_color(value):
+    """Build a role Color, shared between roles with the same value"""
+    return discord.Color(value)
+
+class TokenBucket:
+    """Async token bucket - only blocks once the burst budget is spent"""
+    
+    def __init__(self, rate, period=1.0):
+        self.rate = rate
+        self.period = period
+        self.tokens = float(rate)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Take one token, sleeping until one is available"""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate / self.period)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) * self.period / self.rate)
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
 class BackupRestoreSystem:
     """Handles backup restore operations"""
     
+    # Discord's global limit is 50 requests/s - stay a little under it
+    RATE_LIMIT = 45
+    MAX_RETRIES = 3
+    # Concurrent creates in flight at once, kept below the rate bucket
+    MAX_CONCURRENCY = 8
+    
     def __init__(self, bot, db):
         self.bot = bot
         self.db = db
+        self.limiter = TokenBucket(self.RATE_LIMIT, 1.0)
+        self.sem = asyncio.Semaphore(self.MAX_CONCURRENCY)
+    
+    async def _retry_with_backoff(self, func, *args, **kwargs):
+        """Call an API coroutine under the limiter, retrying on 429 after retry_after"""
+        for attempt in range(self.MAX_RETRIES + 1):
+            async with self.limiter:
+                try:
+                    return await func(*args, **kwargs)
+                except discord.HTTPException as e:
+                    if e.status != 429 or attempt == self.MAX_RETRIES:
+                        raise
+                    retry_after = getattr(e, 'retry_after', None) or 1.0
+            print(f"[RESTORE] Rate limited, retrying in {retry_after}s")
+            await asyncio.sleep(retry_after)
+    
+    async def _sem_wrap(self, coro):
+        """Run a coroutine while holding the restore concurrency semaphore"""
+        async with self.sem:
+            return await coro
+    
+    async def _delete_wrap(self, target):
+        """Delete a channel or role under the semaphore, logging instead of raising"""
+        async with self.sem:
+            try:
+                await self._retry_with_backoff(target.delete, reason="Backup restore")
+            except Exception as e:
+                print(f"Failed to delete {target.name}: {e}")
+    
+    async def _gather_bounded(self, kind, items, factory):
+        """
+        Run factory(item) for every backup item concurrently
+        
+        Returns: {old_id: created_object} for the items that succeeded
+        """
+        results = await asyncio.gather(
+            *(self._sem_wrap(factory(item)) for item in items),
+            return_exceptions=True
+        )
+        
+        created = {}
+        for item, result in zip(items, results):
+            if isinstance(result, Exception):
+                print(f"Failed to restore {kind} {item['name']}: {result}")
+            elif result is not None:
+                # JSON round-trips can turn snowflakes into str - key maps by int
+                created[int(item['id'])] = result
+        return created
+    
+    async def _create_one_role(self, guild, role_data):
+        """Create a single role from backup data"""
+        return await self._retry_with_backoff(
+            guild.create_role,
+            name=role_data['name'],
+            permissions=_fast_perms(int(role_data['permissions'])),
+            color=_make_color(role_data['color']),
+            hoist=role_data['hoist'],
+            mentionable=role_data['mentionable'],
+            reason="Backup restore"
+        )
+    
+    async def _create_one_category(self, guild, channel_data):
+        """Create a single category from backup data"""
+        return await self._retry_with_backoff(
+            guild.create_category,
+            name=channel_data['name'],
+            reason="Backup restore"
+        )
+    
+    def _build_overwrites(self, channel_data, role_map, default_role):
+        """Build a channel's role overwrites from backup data"""
+        # JSON object keys are always str, role_map is keyed by int
+        _as_int = int
+        overwrites = {}
+        for target_id, overwrite_data in channel_data.get('overwrites', {}).items():
+            if overwrite_data['type'] == 'role':
+                target = role_map.get(_as_int(target_id), default_role)
+            else:
+                continue  # Skip member overwrites
+            
+            overwrites[target] = _make_overwrite(overwrite_data['allow'], overwrite_data['deny'])
+        return overwrites
+    
+    async def _create_one_channel(self, guild, channel_data, role_map, category_map, default_role):
+        """Create a single text/voice channel from backup data"""
+        # Get category if exists
+        category = None
+        if channel_data.get('category_id'):
+            category = category_map.get(int(channel_data['category_id']))
+        
+        overwrites = self._build_overwrites(channel_data, role_map, default_role)
+        
+        # Create channel based on type
+        if channel_data['type'] == 'text':
+            return await self._retry_with_backoff(
+                guild.create_text_channel,
+                name=channel_data['name'],
+                category=category,
+                overwrites=overwrites,
+                topic=channel_data.get('topic'),
+                slowmode_delay=channel_data.get('slowmode_delay', 0),
+                nsfw=channel_data.get('nsfw', False),
+                reason="Backup restore"
+            )
+        elif channel_data['type'] == 'voice':
+            return await self._retry_with_backoff(
+                guild.create_voice_channel,
+                name=channel_data['name'],
+                category=category,
+                overwrites=overwrites,
+                bitrate=channel_data.get('bitrate', 64000),
+                user_limit=channel_data.get('user_limit', 0),
+                reason="Backup restore"
+            )
+        return None
+    
+    def _match_roles(self, guild, roles_data):
+        """Map backup role IDs to existing roles with the same name"""
+        existing = {role.name: role for role in guild.roles if not role.is_default()}
+        matched = {}
+        for role_data in roles_data:
+            # pop so two backup roles sharing a name don't claim the same role
+            role = existing.pop(role_data['name'], None)
+            if role is not None:
+                matched[int(role_data['id'])] = role
+        return matched
+    
+    def _match_channels(self, guild, categories, non_cats):
+        """Map backup channel IDs to existing channels with the same (type, name, category name)"""
+        existing = {}
+        for channel in guild.channels:
+            category = channel.category
+            existing[(str(channel.type), channel.name, category.name if category else None)] = channel
+        
+        matched = {}
+        category_names = {}
+        for channel_data in categories:
+            category_names[int(channel_data['id'])] = channel_data['name']
+            channel = existing.pop(('category', channel_data['name'], None), None)
+            if channel is not None:
+                matched[int(channel_data['id'])] = channel
+        
+        for channel_data in non_cats:
+            category_id = channel_data.get('category_id')
+            category_name = category_names.get(int(category_id)) if category_id else None
+            channel = existing.pop((channel_data['type'], channel_data['name'], category_name), None)
+            if channel is not None:
+                matched[int(channel_data['id'])] = channel
+        return matched
+    
+    async def _update_one_role(self, role, role_data):
+        """Edit an existing role to match backup data - no request if it already does"""
+        if (role.permissions.value == role_data['permissions']
+                and role.color.value == role_data['color']
+                and role.hoist == role_data['hoist']
+                and role.mentionable == role_data['mentionable']):
+            return role
+        
+        await self._retry_with_backoff(
+            role.edit,
+            permissions=_fast_perms(int(role_data['permissions'])),
+            color=_make_color(role_data['color']),
+            hoist=role_data['hoist'],
+            mentionable=role_data['mentionable'],
+            reason="Backup restore"
+        )
+        return role
+    
+    async def _update_one_channel(self, channel, channel_data, role_map, default_role):
+        """Edit an existing channel to match backup data - no request if it already does"""
+        changes = {}
+        
+        overwrites = self._build_overwrites(channel_data, role_map, default_role)
+        if channel.overwrites != overwrites:
+            changes['overwrites'] = overwrites
+        
+        if channel_data['type'] == 'text':
+            wanted = {
+                'topic': channel_data.get('topic'),
+                'slowmode_delay': channel_data.get('slowmode_delay', 0),
+                'nsfw': channel_data.get('nsfw', False),
+            }
+        elif channel_data['type'] == 'voice':
+            wanted = {
+                'bitrate': channel_data.get('bitrate', 64000),
+                'user_limit': channel_data.get('user_limit', 0),
+            }
+        else:
+            wanted = {}
+        
+        for field, value in wanted.items():
+            if getattr(channel, field) != value:
+                changes[field] = value
+        
+        if changes:
+            await self._retry_with_backoff(channel.edit, reason="Backup restore", **changes)
+        return channel
+    
+    async def _restore_positions(self, guild, roles_data, role_map, channels_data, channel_map):
+        """Reapply backup ordering with one bulk request for channels and one for roles"""
+        channel_positions = [
+            {'id': channel_map[int(c['id'])].id, 'position': c['position']}
+            for c in channels_data
+            if 'position' in c and int(c['id']) in channel_map
+        ]
+        if channel_positions:
+            try:
+                await self._retry_with_backoff(
+                    guild._state.http.bulk_channel_update,
+                    guild.id, channel_positions, reason="Backup restore"
+                )
+            except Exception as e:
+                print(f"Failed to restore channel positions: {e}")
+        
+        role_positions = {
+            role_map[int(r['id'])]: r['position']
+            for r in roles_data
+            if r.get('position') and int(r['id']) in role_map
+        }
+        if role_positions:
+            try:
+                await self._retry_with_backoff(guild.edit_role_positions, role_positions, reason="Backup restore")
+            except Exception as e:
+                print(f"Failed to restore role positions: {e}")
     
-    async def restore_backup(self, guild, backup_data, progress_callback=None):
+    async def _restore_roles(self, guild, roles_data, kept_roles):
+        """Create missing roles and update kept ones - returns {old_id: role}"""
+        role_map = await self._gather_bounded(
+            'role', [r for r in roles_data if int(r['id']) not in kept_roles],
+            lambda role_data: self._create_one_role(guild, role_data)
+        )
+        await self._gather_bounded(
+            'role', [r for r in roles_data if int(r['id']) in kept_roles],
+            lambda role_data: self._update_one_role(kept_roles[int(role_data['id'])], role_data)
+        )
+        role_map.update(kept_roles)
+        return role_map
+    
+    async def _restore_categories(self, guild, categories, kept_channels):
+        """Create missing categories - returns {old_id: category}, kept ones included"""
+        category_map = await self._gather_bounded(
+            'category', [c for c in categories if int(c['id']) not in kept_channels],
+            lambda channel_data: self._create_one_category(guild, channel_data)
+        )
+        category_map.update(
+            (int(c['id']), kept_channels[int(c['id'])])
+            for c in categories if int(c['id']) in kept_channels
+        )
+        return category_map
+    
+    async def restore_backup(self, guild, backup_data, progress_callback=None, full_wipe=False):
         """
         Restore a backup
         
+        Roles and channels that already exist with the same name (channels:
+        same type, name and category) are kept and only edited where they
+        differ from the backup; everything else is deleted or created.
+        
         Args:
             guild: Discord Guild object
             backup_data: Backup data dictionary
             progress_callback: async function to call for progress updates
+            full_wipe: Delete every role/channel and recreate all of them
         
         Returns: (success, message)
         """
         try:
-            if progress_callback:
-                await progress_callback("🗑️ Deleting existing channels...")
+            roles_data = backup_data.get('roles', [])
             
-            # Delete all existing channels
-            for channel in guild.channels:
-                try:
-                    await channel.delete(reason="Backup restore")
-                    await asyncio.sleep(0.5)  # Rate limit protection
-                except:
-                    pass
+            # Split categories from channels once, channels in position order
+            channels_data = backup_data.get('channels', [])
+            categories = [c for c in channels_data if c.get('is_category')]
+            non_cats = sorted(
+                (c for c in channels_data if not c.get('is_category')),
+                key=lambda c: c.get('position', 0)
+            )
+            
+            # Existing objects that map onto the backup, keyed by backup ID
+            if full_wipe:
+                kept_roles, kept_channels = {}, {}
+            else:
+                kept_roles = self._match_roles(guild, roles_data)
+                kept_channels = self._match_channels(guild, categories, non_cats)
+            kept_role_ids = {role.id for role in kept_roles.values()}
+            kept_channel_ids = {channel.id for channel in kept_channels.values()}
             
             if progress_callback:
-                await progress_callback("🗑️ Deleting existing roles...")
+                await progress_callback("🗑️ Deleting existing channels...")
             
-            # Delete all existing roles (except @everyone)
-            for role in guild.roles:
-                if not role.is_default():
-                    try:
-                        await role.delete(reason="Backup restore")
-                        await asyncio.sleep(0.3)  # Rate limit protection
-                    except:
-                        pass
+            # Delete channels that aren't in the backup
+            await asyncio.gather(*(
+                self._delete_wrap(channel) for channel in list(guild.channels)
+                if channel.id not in kept_channel_ids
+            ))
             
             if progress_callback:
-                await progress_callback("🎭 Restoring roles...")
+                await progress_callback("🗑️ Deleting existing roles...")
             
-            # Restore roles
-            role_map = {}  # Map old IDs to new roles
-            for role_data in backup_data.get('roles', []):
-                try:
-                    permissions = discord.Permissions(role_data['permissions'])
-                    color = discord.Color(role_data['color'])
-                    
-                    new_role = await guild.create_role(
-                        name=role_data['name'],
-                        permissions=permissions,
-                        color=color,
-                        hoist=role_data['hoist'],
-                        mentionable=role_data['mentionable'],
-                        reason="Backup restore"
-                    )
-                    
-                    role_map[role_data['id']] = new_role
-                    await asyncio.sleep(0.3)
-                except Exception as e:
-                    print(f"Failed to restore role {role_data['name']}: {e}")
+            # Delete roles that aren't in the backup (except @everyone), highest first
+            roles_to_delete = sorted(
+                (role for role in guild.roles
+                 if not role.is_default() and role.id not in kept_role_ids),
+                key=lambda r: r.position,
+                reverse=True
+            )
+            await asyncio.gather(*(self._delete_wrap(role) for role in roles_to_delete))
             
             if progress_callback:
-                await progress_callback("📁 Restoring categories...")
+                await progress_callback("🎭 Restoring roles and categories...")
             
-            # Restore categories first
-            category_map = {}
-            channels_data = backup_data.get('channels', [])
-            
-            for channel_data in channels_data:
-                if channel_data.get('is_category'):
-                    try:
-                        new_category = await guild.create_category(
-                            name=channel_data['name'],
-                            position=channel_data['position'],
-                            reason="Backup restore"
-                        )
-                        category_map[channel_data['id']] = new_category
-                        await asyncio.sleep(0.5)
-                    except Exception as e:
-                        print(f"Failed to restore category {channel_data['name']}: {e}")
+            # Categories don't depend on roles (only channel overwrites do), so build
+            # both at once - they still share the one rate limiter
+            role_map, category_map = await asyncio.gather(
+                self._restore_roles(guild, roles_data, kept_roles),
+                self._restore_categories(guild, categories, kept_channels)
+            )
             
             if progress_callback:
                 await progress_callback("💬 Restoring channels...")
             
-            # Restore channels
-            for channel_data in channels_data:
-                if channel_data.get('is_category'):
-                    continue  # Already created
-                
-                try:
-                    # Get category if exists
-                    category = None
-                    if channel_data.get('category_id'):
-                        category = category_map.get(channel_data['category_id'])
-                    
-                    # Build overwrites
-                    overwrites = {}
-                    for target_id, overwrite_data in channel_data.get('overwrites', {}).items():
-                        if overwrite_data['type'] == 'role':
-                            target = role_map.get(target_id) or guild.default_role
-                        else:
-                            continue  # Skip member overwrites
-                        
-                        allow = discord.Permissions(overwrite_data['allow'])
-                        deny = discord.Permissions(overwrite_data['deny'])
-                        overwrites[target] = discord.PermissionOverwrite.from_pair(allow, deny)
-                    
-                    # Create channel based on type
-                    if channel_data['type'] == 'text':
-                        await guild.create_text_channel(
-                            name=channel_data['name'],
-                            category=category,
-                            overwrites=overwrites,
-                            position=channel_data['position'],
-                            topic=channel_data.get('topic'),
-                            slowmode_delay=channel_data.get('slowmode_delay', 0),
-                            nsfw=channel_data.get('nsfw', False),
-                            reason="Backup restore"
-                        )
-                    elif channel_data['type'] == 'voice':
-                        await guild.create_voice_channel(
-                            name=channel_data['name'],
-                            category=category,
-                            overwrites=overwrites,
-                            position=channel_data['position'],
-                            bitrate=channel_data.get('bitrate', 64000),
-                            user_limit=channel_data.get('user_limit', 0),
-                            reason="Backup restore"
-                        )
-                    
-                    await asyncio.sleep(0.5)
-                except Exception as e:
-                    print(f"Failed to restore channel {channel_data['name']}: {e}")
+            # Restore channels, update the ones we kept. default_role is resolved once
+            # here and passed down so every channel maps @everyone to the same object
+            default_role = guild.default_role
+            channel_map = await self._gather_bounded(
+                'channel', [c for c in non_cats if int(c['id']) not in kept_channels],
+                lambda channel_data: self._create_one_channel(
+                    guild, channel_data, role_map, category_map, default_role
+                )
+            )
+            kept_non_cats = [c for c in non_cats if int(c['id']) in kept_channels]
+            await self._gather_bounded(
+                'channel', kept_non_cats,
+                lambda channel_data: self._update_one_channel(
+                    kept_channels[int(channel_data['id'])], channel_data, role_map, default_role
+                )
+            )
+            channel_map.update((int(c['id']), kept_channels[int(c['id'])]) for c in kept_non_cats)
+            
+            # Creates don't pass a position (each one would reorder the whole list) -
+            # apply the backup order afterwards in one bulk request
+            await self._restore_positions(
+                guild,
+                roles_data, role_map,
+                categories + non_cats, {**category_map, **channel_map}
+            )
             
             if progress_callback:
                 await progress_callback("⚙️ Restoring settings...")
@@ -302,7 +613,7 @@ class BackupRestoreSystem:
             settings = backup_data.get('settings', {})
             try:
                 if settings.get('name'):
-                    await guild.edit(name=settings['name'])
+                    await self._retry_with_backoff(guild.edit, name=settings['name'])
             except:
                 pass
             
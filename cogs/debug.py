@@ -6,8 +6,9 @@ Debug commands, error code explanations, permission tracing, and owner bypass
 import discord
 from discord.ext import commands
 import asyncio
-from datetime import datetime
-from utils.database import Database
+import time
+from itertools import islice
+from types import MappingProxyType
 from utils.config import Config
 
 
@@ -168,36 +169,361 @@ ERROR_CODES = {
     }
 }
 
+# Read-only from here on - the precomputed embeds below are built from it
+ERROR_CODES = MappingProxyType({
+    code: {**error, 'solutions': tuple(error['solutions'])}
+    for code, error in ERROR_CODES.items()
+})
+
+
+def _build_error_embed(code, error):
+    """Build the ;debug <code> embed for one error code"""
+    embed = discord.Embed(
+        title=f"Error: {code}",
+        description=f"**{error['name']}**\n\n{error['description']}",
+        color=0xE74C3C
+    )
+
+    solutions = "\n".join(f"- {s}" for s in error['solutions'])
+    embed.add_field(name="Solutions", value=solutions, inline=False)
+
+    embed.set_footer(text="BFOS Debug - If issue persists, contact support")
+    return embed
+
+
+# ERROR_CODES is static - build each lookup embed once and reuse it
+# (discord.py serializes the embed on send, so sharing one is safe)
+PRECOMPUTED_ERROR_EMBEDS = {code: _build_error_embed(code, error) for code, error in ERROR_CODES.items()}
+
+# ;debug <code> accepts '0xCNTF' or 'CNTF' in any case - map both upper-cased forms to the key
+_ERROR_CODE_ALIASES = {code.upper(): code for code in ERROR_CODES} | {code[2:].upper(): code for code in ERROR_CODES}
+
+# ;debug codes listing
+_CODES_LIST_TEXT = "".join(f"`{code}` - {data['name']}\n" for code, data in islice(ERROR_CODES.items(), 15))
+
+_CODES_EMBED = discord.Embed(
+    title="Error Codes Reference",
+    description="All BFOS error codes and their meanings.",
+    color=0x9B59B6
+)
+_CODES_EMBED.add_field(name="Error Codes", value=_CODES_LIST_TEXT, inline=False)
+_CODES_EMBED.set_footer(text="Use ;debug <code> for details")
+
+
+def _log_timestamp() -> str:
+    """HH:MM:SS.mmm for console traces, without building a datetime"""
+    now = time.time()
+    return f"{time.strftime('%H:%M:%S', time.localtime(now))}.{int(now % 1 * 1000):03d}"
+
+
+# ;debug logging sendall examples - {author_tag}/{author}/{channel} are filled in per call
+_LOG_EXAMPLE_TEMPLATES = (
+    # Messages
+    {
+        'title': '🗑️ Message Deleted',
+        'color': 0xE74C3C,
+        'fields': (
+            ('Author', '{author_tag}', True),
+            ('Channel', '{channel}', True),
+            ('Sent', '<t:1234567890:R>', True),
+            ('Content', '```\nExample deleted message content\n```', False),
+            ('Deleted By', '{author_tag}', True),
+        )
+    },
+    {
+        'title': '✏️ Message Edited',
+        'color': 0x3498DB,
+        'fields': (
+            ('Author', '{author_tag}', True),
+            ('Channel', '{channel}', True),
+            ('Jump', '[Click](https://discord.com)', True),
+            ('Before', '```\nOriginal message\n```', False),
+            ('After', '```\nEdited message\n```', False),
+        )
+    },
+    # Members
+    {
+        'title': '📥 Member Joined',
+        'color': 0x2ECC71,
+        'fields': (
+            ('User', '{author_tag}', True),
+            ('Account Age', '2 years old', True),
+            ('Member #', '100', True),
+        )
+    },
+    {
+        'title': '📤 Member Left',
+        'color': 0x95A5A6,
+        'fields': (
+            ('User', '{author_tag}', True),
+            ('Joined', '<t:1234567890:R>', True),
+            ('Roles', '@Member, @Verified', True),
+        )
+    },
+    {
+        'title': '🔨 Member Banned',
+        'color': 0xE74C3C,
+        'fields': (
+            ('User', '{author_tag}', True),
+            ('Banned By', '{author}', True),
+            ('Reason', 'Example ban reason', False),
+        )
+    },
+    {
+        'title': '🔓 Member Unbanned',
+        'color': 0x27AE60,
+        'fields': (
+            ('User', '{author_tag}', True),
+            ('Unbanned By', '{author}', True),
+        )
+    },
+    # Roles
+    {
+        'title': '✨ Role Created',
+        'color': 0x2ECC71,
+        'fields': (
+            ('Role', '@NewRole (`123456789`)', True),
+            ('Color', '#FF0000', True),
+            ('Created By', '{author}', True),
+        )
+    },
+    {
+        'title': '⚙️ Role Updated',
+        'color': 0xF1C40F,
+        'fields': (
+            ('Role', '@UpdatedRole (`123456789`)', True),
+            ('Changes', '**Name:** `Old` → `New`\n**Color:** `#000` → `#FFF`', False),
+        )
+    },
+    # Channels
+    {
+        'title': '📁 Channel Created',
+        'color': 0x2ECC71,
+        'fields': (
+            ('Channel', '{channel}', True),
+            ('Type', 'Text', True),
+            ('Created By', '{author}', True),
+        )
+    },
+    {
+        'title': '🔐 Permission Update',
+        'color': 0x9B59B6,
+        'fields': (
+            ('Channel', '{channel}', False),
+            ('Changes\n👥 @everyone', '✅ View Channel\n❌ Send Messages\n✅ Read Message History', False),
+            ('Updated By', '{author}', True),
+        )
+    },
+    # Voice
+    {
+        'title': '🎤 Voice Join',
+        'color': 0x2ECC71,
+        'fields': (
+            ('User', '{author_tag}', True),
+            ('Channel', '🔊 General', True),
+        )
+    },
+    {
+        'title': '🔇 Voice Leave',
+        'color': 0x95A5A6,
+        'fields': (
+            ('User', '{author_tag}', True),
+            ('Channel', '🔊 General', True),
+            ('Duration', '5 minutes', True),
+        )
+    },
+    # Moderation
+    {
+        'title': '⚠️ User Warned',
+        'color': 0xFFAA00,
+        'fields': (
+            ('User', '{author_tag}', True),
+            ('Moderator', '{author}', True),
+            ('Case', '`#1`', True),
+            ('Total Warnings', '`1`', True),
+            ('Reason', '```\nExample warning reason\n```', False),
+        )
+    },
+    {
+        'title': '🔨 User Banned',
+        'color': 0xE74C3C,
+        'fields': (
+            ('User', '{author_tag}', True),
+            ('Moderator', '{author}', True),
+            ('Case', '`#2`', True),
+            ('Duration', '`7 days`', True),
+            ('Reason', '```\nExample ban reason\n```', False),
+        )
+    },
+    {
+        'title': '👢 User Kicked',
+        'color': 0xE67E22,
+        'fields': (
+            ('User', '{author_tag}', True),
+            ('Moderator', '{author}', True),
+            ('Case', '`#3`', True),
+            ('Reason', '```\nExample kick reason\n```', False),
+        )
+    },
+    {
+        'title': '🔇 User Muted',
+        'color': 0x9B59B6,
+        'fields': (
+            ('User', '{author_tag}', True),
+            ('Moderator', '{author}', True),
+            ('Case', '`#4`', True),
+            ('Duration', '`1 hour`', True),
+            ('Reason', '```\nExample mute reason\n```', False),
+        )
+    },
+    {
+        'title': '🔊 User Unmuted',
+        'color': 0x27AE60,
+        'fields': (
+            ('User', '{author_tag}', True),
+            ('Moderator', '{author}', True),
+            ('Reason', '```\nMute expired\n```', False),
+        )
+    },
+    # Verification
+    {
+        'title': '✅ Verification Passed',
+        'color': 0x2ECC71,
+        'fields': (
+            ('User', '{author_tag}', True),
+            ('Status', '`SUCCESS`', True),
+            ('Response Q1', '```\nFound via Discord search\n```', False),
+        )
+    },
+    {
+        'title': '❌ Verification Failed',
+        'color': 0xE74C3C,
+        'fields': (
+            ('User', '{author_tag}', True),
+            ('Status', '`FAILED`', True),
+            ('Submitted Code', '`123456`', True),
+        )
+    },
+    # BFOS
+    {
+        'title': '🤖 BFOS: Module',
+        'color': 0x9B59B6,
+        'fields': (
+            ('Executed By', '{author_tag}', True),
+            ('Module', '`warns`', True),
+            ('Action', '`enabled`', True),
+        )
+    },
+    {
+        'title': '🤖 BFOS: Backup',
+        'color': 0x00AAFF,
+        'fields': (
+            ('Executed By', '{author_tag}', True),
+            ('Backup', '`ABC123`', True),
+            ('Action', '`created`', True),
+        )
+    },
+)
+
+
+# Per-channel send limit used to pace the sendall examples
+_EXAMPLE_BURST = 5
+_EXAMPLE_BURST_DELAY = 5
+
+
+def _build_help_embed(include_owner: bool):
+    """Build the ;debug menu embed, with or without the bot owner section"""
+    embed = discord.Embed(
+        title="Debug Menu",
+        description="Debug tools for BlockForge OS.",
+        color=0x3498DB
+    )
+
+    # Admin commands
+    embed.add_field(
+        name="Admin Commands",
+        value=(
+            "`;debug <error_code>` - Explain an error code\n"
+            "`;debug codes` - List all error codes\n"
+            "`;debug logging sendall` - Send all log embed examples"
+        ),
+        inline=False
+    )
+
+    # Bot owner commands
+    if include_owner:
+        embed.add_field(
+            name="Bot Owner Commands",
+            value=(
+                "`;debug true/false` - Toggle debug logging (console)\n"
+                "`;debug logs` - Show current debug state\n"
+                "`;debug permissions` - Toggle permission trace (console)\n"
+                "`;debug ownerbypass true/false` - Demote server owner in this guild"
+            ),
+            inline=False
+        )
+
+    embed.add_field(
+        name="Error Code Format",
+        value="Error codes look like: `0xCNTF`, `0xMODL`, etc.",
+        inline=False
+    )
+    embed.set_footer(text=f"BFOS Debug v{Config.VERSION}")
+    return embed
+
+
+# Access levels for ;debug subcommands
+_OWNER = 'owner'
+_ADMIN = 'admin'
+
 
 class Debug(commands.Cog):
     """Debug commands for BlockForge OS"""
 
     def __init__(self, bot):
         self.bot = bot
-        self.db = Database()
 
         # Debug state (runtime only, not persisted)
         self.debug_enabled = False
         self.debug_permissions = False
+        self.debug_log = self._debug_log_off
+        self.perm_log = self._perm_log_off
         self.owner_bypass_guilds = set()  # guild_ids where server owner is demoted to regular user
+        self._bypass_snapshot = frozenset()  # read-only copy for is_owner_demoted, refreshed on change
+
+        # ;debug menu never changes at runtime - build both variants once
+        self._help_embed_owner = _build_help_embed(include_owner=True)
+        self._help_embed_admin = _build_help_embed(include_owner=False)
 
     # ==================== DEBUG HELPER METHODS ====================
 
-    def debug_log(self, category: str, message: str):
-        """Print debug log to console if debug is enabled"""
-        if self.debug_enabled:
-            timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-            print(f"[DEBUG {timestamp}] [{category}] {message}")
+    # debug_log/perm_log are bound per instance to the _on or _off variant when
+    # the matching flag is toggled, so a disabled trace is a bare no-op call
+
+    def _debug_log_on(self, category: str, message: str):
+        """Print debug log to console"""
+        print(f"[DEBUG {_log_timestamp()}] [{category}] {message}")
+
+    def _debug_log_off(self, category: str, message: str):
+        """Debug logging disabled"""
+
+    def _perm_log_on(self, message: str):
+        """Print permission trace to console"""
+        print(f"[PERM-TRACE {_log_timestamp()}] {message}")
 
-    def perm_log(self, message: str):
-        """Print permission trace to console if permission debugging is enabled"""
-        if self.debug_permissions:
-            timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-            print(f"[PERM-TRACE {timestamp}] {message}")
+    def _perm_log_off(self, message: str):
+        """Permission trace disabled"""
 
     def is_owner_demoted(self, guild_id: int) -> bool:
         """Check if server owner is demoted in this guild (for permission testing)"""
-        return guild_id in self.owner_bypass_guilds
+        return guild_id in self._bypass_snapshot
+
+    async def _require_owner(self, ctx) -> bool:
+        """Reply and return False unless the bot owner invoked the command"""
+        if ctx.author.id != Config.BOT_OWNER_ID:
+            await ctx.send("Bot owner only.", delete_after=5)
+            return False
+        return True
 
     # ==================== COMMANDS ====================
 
@@ -219,410 +545,173 @@ class Debug(commands.Cog):
         """
         if not args:
             # Show debug help
-            embed = discord.Embed(
-                title="Debug Menu",
-                description="Debug tools for BlockForge OS.",
-                color=0x3498DB
-            )
-
-            # Admin commands
-            embed.add_field(
-                name="Admin Commands",
-                value=(
-                    "`;debug <error_code>` - Explain an error code\n"
-                    "`;debug codes` - List all error codes\n"
-                    "`;debug logging sendall` - Send all log embed examples"
-                ),
-                inline=False
-            )
-
-            # Bot owner commands
             if ctx.author.id == Config.BOT_OWNER_ID:
-                embed.add_field(
-                    name="Bot Owner Commands",
-                    value=(
-                        "`;debug true/false` - Toggle debug logging (console)\n"
-                        "`;debug logs` - Show current debug state\n"
-                        "`;debug permissions` - Toggle permission trace (console)\n"
-                        "`;debug ownerbypass true/false` - Demote server owner in this guild"
-                    ),
-                    inline=False
-                )
-
-            embed.add_field(
-                name="Error Code Format",
-                value="Error codes look like: `0xCNTF`, `0xMODL`, etc.",
-                inline=False
-            )
-            embed.set_footer(text=f"BFOS Debug v{Config.VERSION}")
-            await ctx.send(embed=embed)
+                await ctx.send(embed=self._help_embed_owner)
+            else:
+                await ctx.send(embed=self._help_embed_admin)
             return
 
         first_arg = args[0].lower()
 
-        # ==================== BOT OWNER COMMANDS ====================
+        # Named subcommands resolve through one lookup; anything else is an
+        # error code (or unknown) and needs administrator
+        entry = self._SUBCOMMANDS.get(first_arg)
+        level = entry[1] if entry else _ADMIN
 
-        # Toggle debug mode
-        if first_arg in ('true', 'false', 'on', 'off'):
-            if ctx.author.id != Config.BOT_OWNER_ID:
-                await ctx.send("Bot owner only.", delete_after=5)
+        if level == _OWNER:
+            if not await self._require_owner(ctx):
                 return
-            self.debug_enabled = first_arg in ('true', 'on')
-            status = "ENABLED" if self.debug_enabled else "DISABLED"
-            await ctx.send(f"Debug logging: **{status}** (output to console)")
-            if self.debug_enabled:
-                self.debug_log("SYSTEM", "Debug logging enabled")
+        elif not ctx.author.guild_permissions.administrator and ctx.author.id != Config.BOT_OWNER_ID:
+            await ctx.send("You need administrator permissions to use debug commands.", delete_after=5)
             return
 
-        # Show debug state
-        if first_arg == 'logs':
-            if ctx.author.id != Config.BOT_OWNER_ID:
-                await ctx.send("Bot owner only.", delete_after=5)
-                return
-            embed = discord.Embed(title="Debug State", color=0x3498DB)
-            embed.add_field(
-                name="Debug Logging",
-                value="ENABLED" if self.debug_enabled else "DISABLED",
-                inline=True
-            )
-            embed.add_field(
-                name="Permission Trace",
-                value="ENABLED" if self.debug_permissions else "DISABLED",
-                inline=True
-            )
-            bypass_text = "None"
-            if self.owner_bypass_guilds:
-                bypass_text = "\n".join(str(gid) for gid in self.owner_bypass_guilds)
-            embed.add_field(
-                name="Owner Bypass Guilds",
-                value=bypass_text,
-                inline=False
-            )
-            embed.set_footer(text=f"BFOS Debug v{Config.VERSION}")
-            await ctx.send(embed=embed)
+        if entry:
+            await entry[0](self, ctx, args)
             return
 
-        # Toggle permission trace
-        if first_arg == 'permissions':
-            if ctx.author.id != Config.BOT_OWNER_ID:
-                await ctx.send("Bot owner only.", delete_after=5)
-                return
-            self.debug_permissions = not self.debug_permissions
-            status = "ENABLED" if self.debug_permissions else "DISABLED"
-            await ctx.send(f"Permission trace: **{status}** (output to console)")
+        # Handle error code lookup
+        code_upper = first_arg.upper()
+        canonical = _ERROR_CODE_ALIASES.get(code_upper)
+        if canonical is not None:
+            await ctx.send(embed=PRECOMPUTED_ERROR_EMBEDS[canonical])
             return
-
-        # Toggle owner bypass for current guild
-        if first_arg == 'ownerbypass':
-            if ctx.author.id != Config.BOT_OWNER_ID:
-                await ctx.send("Bot owner only.", delete_after=5)
-                return
-            if len(args) < 2:
-                is_demoted = ctx.guild.id in self.owner_bypass_guilds
-                status = "ENABLED" if is_demoted else "DISABLED"
-                await ctx.send(f"Owner bypass in this guild: **{status}**\nWhen enabled, the server owner is treated as a regular user and must have BFOS permissions assigned.")
-                return
-
-            value = args[1].lower()
-            if value in ('true', 'on'):
-                self.owner_bypass_guilds.add(ctx.guild.id)
-                await ctx.send(f"Owner bypass **ENABLED** for this guild.\nServer owner will be treated as a regular user (BFOS permissions required).")
-                self.perm_log(f"Owner bypass ENABLED for guild {ctx.guild.id} ({ctx.guild.name})")
-            elif value in ('false', 'off'):
-                self.owner_bypass_guilds.discard(ctx.guild.id)
-                await ctx.send(f"Owner bypass **DISABLED** for this guild.\nServer owner has full access again.")
-                self.perm_log(f"Owner bypass DISABLED for guild {ctx.guild.id} ({ctx.guild.name})")
-            else:
-                await ctx.send("Usage: `;debug ownerbypass <true/false>`")
+        if first_arg.startswith('0x'):
+            await ctx.send(f"Unknown error code: `0x{code_upper[2:]}`\n\nUse `;debug codes` to see all error codes.")
             return
 
-        # ==================== ADMIN COMMANDS ====================
+        await ctx.send(f"Unknown debug command: `{' '.join(args)}`\n\nUse `;debug` for help.")
 
-        # These require at minimum administrator permission
-        if not ctx.author.guild_permissions.administrator and ctx.author.id != Config.BOT_OWNER_ID:
-            await ctx.send("You need administrator permissions to use debug commands.", delete_after=5)
-            return
+    # ==================== SUBCOMMANDS ====================
 
-        # Handle error code lookup
-        if first_arg.startswith('0x') or first_arg.upper() in ERROR_CODES:
-            code = first_arg.upper()
-            if not code.startswith('0x'):
-                code = '0x' + code
-
-            if code in ERROR_CODES:
-                error = ERROR_CODES[code]
-                embed = discord.Embed(
-                    title=f"Error: {code}",
-                    description=f"**{error['name']}**\n\n{error['description']}",
-                    color=0xE74C3C
-                )
-
-                solutions = "\n".join(f"- {s}" for s in error['solutions'])
-                embed.add_field(name="Solutions", value=solutions, inline=False)
-
-                embed.set_footer(text="BFOS Debug - If issue persists, contact support")
-                await ctx.send(embed=embed)
-            else:
-                await ctx.send(f"Unknown error code: `{code}`\n\nUse `;debug codes` to see all error codes.")
+    async def _debug_toggle(self, ctx, args):
+        """;debug true/false - toggle debug logging"""
+        first_arg = args[0].lower()
+        self.debug_enabled = first_arg in ('true', 'on')
+        self.debug_log = self._debug_log_on if self.debug_enabled else self._debug_log_off
+        status = "ENABLED" if self.debug_enabled else "DISABLED"
+        await ctx.send(f"Debug logging: **{status}** (output to console)")
+        if self.debug_enabled:
+            self.debug_log("SYSTEM", "Debug logging enabled")
+
+    async def _debug_logs(self, ctx, args):
+        """;debug logs - show debug state"""
+        embed = discord.Embed(title="Debug State", color=0x3498DB)
+        embed.add_field(
+            name="Debug Logging",
+            value="ENABLED" if self.debug_enabled else "DISABLED",
+            inline=True
+        )
+        embed.add_field(
+            name="Permission Trace",
+            value="ENABLED" if self.debug_permissions else "DISABLED",
+            inline=True
+        )
+        bypass_text = "None"
+        if self.owner_bypass_guilds:
+            bypass_text = "\n".join(str(gid) for gid in self.owner_bypass_guilds)
+        embed.add_field(
+            name="Owner Bypass Guilds",
+            value=bypass_text,
+            inline=False
+        )
+        embed.set_footer(text=f"BFOS Debug v{Config.VERSION}")
+        await ctx.send(embed=embed)
+
+    async def _debug_permissions(self, ctx, args):
+        """;debug permissions - toggle permission trace"""
+        self.debug_permissions = not self.debug_permissions
+        self.perm_log = self._perm_log_on if self.debug_permissions else self._perm_log_off
+        status = "ENABLED" if self.debug_permissions else "DISABLED"
+        await ctx.send(f"Permission trace: **{status}** (output to console)")
+
+    async def _debug_ownerbypass(self, ctx, args):
+        """;debug ownerbypass true/false - toggle owner bypass for current guild"""
+        if len(args) < 2:
+            is_demoted = ctx.guild.id in self.owner_bypass_guilds
+            status = "ENABLED" if is_demoted else "DISABLED"
+            await ctx.send(f"Owner bypass in this guild: **{status}**\nWhen enabled, the server owner is treated as a regular user and must have BFOS permissions assigned.")
             return
 
-        # List all error codes
-        if first_arg == 'codes':
-            embed = discord.Embed(
-                title="Error Codes Reference",
-                description="All BFOS error codes and their meanings.",
-                color=0x9B59B6
-            )
-
-            codes_text = ""
-            for code, data in list(ERROR_CODES.items())[:15]:
-                codes_text += f"`{code}` - {data['name']}\n"
-
-            embed.add_field(name="Error Codes", value=codes_text, inline=False)
-            embed.set_footer(text="Use ;debug <code> for details")
-            await ctx.send(embed=embed)
+        value = args[1].lower()
+        if value in ('true', 'on'):
+            self.owner_bypass_guilds.add(ctx.guild.id)
+            self._bypass_snapshot = frozenset(self.owner_bypass_guilds)
+            await ctx.send(f"Owner bypass **ENABLED** for this guild.\nServer owner will be treated as a regular user (BFOS permissions required).")
+            self.perm_log(f"Owner bypass ENABLED for guild {ctx.guild.id} ({ctx.guild.name})")
+        elif value in ('false', 'off'):
+            self.owner_bypass_guilds.discard(ctx.guild.id)
+            self._bypass_snapshot = frozenset(self.owner_bypass_guilds)
+            await ctx.send(f"Owner bypass **DISABLED** for this guild.\nServer owner has full access again.")
+            self.perm_log(f"Owner bypass DISABLED for guild {ctx.guild.id} ({ctx.guild.name})")
+        else:
+            await ctx.send("Usage: `;debug ownerbypass <true/false>`")
+
+    async def _debug_codes(self, ctx, args):
+        """;debug codes - list all error codes"""
+        await ctx.send(embed=_CODES_EMBED)
+
+    async def _debug_logging(self, ctx, args):
+        """;debug logging sendall - send all log embed examples"""
+        if len(args) > 1 and args[1].lower() in ['sendallemebds', 'sendallemeds', 'sendall', 'all']:
+            await self.send_all_log_examples(ctx)
             return
 
-        # Handle logging test
-        if first_arg == 'logging' and len(args) > 1:
-            if args[1].lower() in ['sendallemebds', 'sendallemeds', 'sendall', 'all']:
-                await self.send_all_log_examples(ctx)
-                return
-
         await ctx.send(f"Unknown debug command: `{' '.join(args)}`\n\nUse `;debug` for help.")
-    
+
+    # first_arg -> (handler, required level)
+    _SUBCOMMANDS = {
+        'true': (_debug_toggle, _OWNER),
+        'false': (_debug_toggle, _OWNER),
+        'on': (_debug_toggle, _OWNER),
+        'off': (_debug_toggle, _OWNER),
+        'logs': (_debug_logs, _OWNER),
+        'permissions': (_debug_permissions, _OWNER),
+        'ownerbypass': (_debug_ownerbypass, _OWNER),
+        'codes': (_debug_codes, _ADMIN),
+        'logging': (_debug_logging, _ADMIN),
+    }
+
     async def send_all_log_examples(self, ctx):
         """Send examples of all logging embeds"""
         await ctx.send("📤 **Sending all log embed examples...**\n*This may take a moment to avoid rate limits.*")
         
-        logging_cog = self.bot.get_cog('LoggingModule')
-        if not logging_cog:
+        # Look the cog up every time - it can be unloaded or reloaded between calls
+        if not self.bot.get_cog('LoggingModule'):
             await ctx.send("❌ Logging module not loaded.")
             return
         
-        examples = [
-            # Messages
-            {
-                'title': '🗑️ Message Deleted',
-                'color': 0xE74C3C,
-                'fields': [
-                    ('Author', f'{ctx.author.mention} (`{ctx.author.id}`)', True),
-                    ('Channel', ctx.channel.mention, True),
-                    ('Sent', '<t:1234567890:R>', True),
-                    ('Content', '```\nExample deleted message content\n```', False),
-                    ('Deleted By', f'{ctx.author.mention} (`{ctx.author.id}`)', True),
-                ]
-            },
-            {
-                'title': '✏️ Message Edited',
-                'color': 0x3498DB,
-                'fields': [
-                    ('Author', f'{ctx.author.mention} (`{ctx.author.id}`)', True),
-                    ('Channel', ctx.channel.mention, True),
-                    ('Jump', '[Click](https://discord.com)', True),
-                    ('Before', '```\nOriginal message\n```', False),
-                    ('After', '```\nEdited message\n```', False),
-                ]
-            },
-            # Members
-            {
-                'title': '📥 Member Joined',
-                'color': 0x2ECC71,
-                'fields': [
-                    ('User', f'{ctx.author.mention} (`{ctx.author.id}`)', True),
-                    ('Account Age', '2 years old', True),
-                    ('Member #', '100', True),
-                ]
-            },
-            {
-                'title': '📤 Member Left',
-                'color': 0x95A5A6,
-                'fields': [
-                    ('User', f'{ctx.author.mention} (`{ctx.author.id}`)', True),
-                    ('Joined', '<t:1234567890:R>', True),
-                    ('Roles', '@Member, @Verified', True),
-                ]
-            },
-            {
-                'title': '🔨 Member Banned',
-                'color': 0xE74C3C,
-                'fields': [
-                    ('User', f'{ctx.author.mention} (`{ctx.author.id}`)', True),
-                    ('Banned By', f'{ctx.author.mention}', True),
-                    ('Reason', 'Example ban reason', False),
-                ]
-            },
-            {
-                'title': '🔓 Member Unbanned',
-                'color': 0x27AE60,
-                'fields': [
-                    ('User', f'{ctx.author.mention} (`{ctx.author.id}`)', True),
-                    ('Unbanned By', f'{ctx.author.mention}', True),
-                ]
-            },
-            # Roles
-            {
-                'title': '✨ Role Created',
-                'color': 0x2ECC71,
-                'fields': [
-                    ('Role', '@NewRole (`123456789`)', True),
-                    ('Color', '#FF0000', True),
-                    ('Created By', f'{ctx.author.mention}', True),
-                ]
-            },
-            {
-                'title': '⚙️ Role Updated',
-                'color': 0xF1C40F,
-                'fields': [
-                    ('Role', '@UpdatedRole (`123456789`)', True),
-                    ('Changes', '**Name:** `Old` → `New`\n**Color:** `#000` → `#FFF`', False),
-                ]
-            },
-            # Channels
-            {
-                'title': '📁 Channel Created',
-                'color': 0x2ECC71,
-                'fields': [
-                    ('Channel', ctx.channel.mention, True),
-                    ('Type', 'Text', True),
-                    ('Created By', f'{ctx.author.mention}', True),
-                ]
-            },
-            {
-                'title': '🔐 Permission Update',
-                'color': 0x9B59B6,
-                'fields': [
-                    ('Channel', ctx.channel.mention, False),
-                    ('Changes\n👥 @everyone', '✅ View Channel\n❌ Send Messages\n✅ Read Message History', False),
-                    ('Updated By', f'{ctx.author.mention}', True),
-                ]
-            },
-            # Voice
-            {
-                'title': '🎤 Voice Join',
-                'color': 0x2ECC71,
-                'fields': [
-                    ('User', f'{ctx.author.mention} (`{ctx.author.id}`)', True),
-                    ('Channel', '🔊 General', True),
-                ]
-            },
-            {
-                'title': '🔇 Voice Leave',
-                'color': 0x95A5A6,
-                'fields': [
-                    ('User', f'{ctx.author.mention} (`{ctx.author.id}`)', True),
-                    ('Channel', '🔊 General', True),
-                    ('Duration', '5 minutes', True),
-                ]
-            },
-            # Moderation
-            {
-                'title': '⚠️ User Warned',
-                'color': 0xFFAA00,
-                'fields': [
-                    ('User', f'{ctx.author.mention} (`{ctx.author.id}`)', True),
-                    ('Moderator', f'{ctx.author.mention}', True),
-                    ('Case', '`#1`', True),
-                    ('Total Warnings', '`1`', True),
-                    ('Reason', '```\nExample warning reason\n```', False),
-                ]
-            },
-            {
-                'title': '🔨 User Banned',
-                'color': 0xE74C3C,
-                'fields': [
-                    ('User', f'{ctx.author.mention} (`{ctx.author.id}`)', True),
-                    ('Moderator', f'{ctx.author.mention}', True),
-                    ('Case', '`#2`', True),
-                    ('Duration', '`7 days`', True),
-                    ('Reason', '```\nExample ban reason\n```', False),
-                ]
-            },
-            {
-                'title': '👢 User Kicked',
-                'color': 0xE67E22,
-                'fields': [
-                    ('User', f'{ctx.author.mention} (`{ctx.author.id}`)', True),
-                    ('Moderator', f'{ctx.author.mention}', True),
-                    ('Case', '`#3`', True),
-                    ('Reason', '```\nExample kick reason\n```', False),
-                ]
-            },
-            {
-                'title': '🔇 User Muted',
-                'color': 0x9B59B6,
-                'fields': [
-                    ('User', f'{ctx.author.mention} (`{ctx.author.id}`)', True),
-                    ('Moderator', f'{ctx.author.mention}', True),
-                    ('Case', '`#4`', True),
-                    ('Duration', '`1 hour`', True),
-                    ('Reason', '```\nExample mute reason\n```', False),
-                ]
-            },
-            {
-                'title': '🔊 User Unmuted',
-                'color': 0x27AE60,
-                'fields': [
-                    ('User', f'{ctx.author.mention} (`{ctx.author.id}`)', True),
-                    ('Moderator', f'{ctx.author.mention}', True),
-                    ('Reason', '```\nMute expired\n```', False),
-                ]
-            },
-            # Verification
-            {
-                'title': '✅ Verification Passed',
-                'color': 0x2ECC71,
-                'fields': [
-                    ('User', f'{ctx.author.mention} (`{ctx.author.id}`)', True),
-                    ('Status', '`SUCCESS`', True),
-                    ('Response Q1', '```\nFound via Discord search\n```', False),
-                ]
-            },
-            {
-                'title': '❌ Verification Failed',
-                'color': 0xE74C3C,
-                'fields': [
-                    ('User', f'{ctx.author.mention} (`{ctx.author.id}`)', True),
-                    ('Status', '`FAILED`', True),
-                    ('Submitted Code', '`123456`', True),
-                ]
-            },
-            # BFOS
-            {
-                'title': '🤖 BFOS: Module',
-                'color': 0x9B59B6,
-                'fields': [
-                    ('Executed By', f'{ctx.author.mention} (`{ctx.author.id}`)', True),
-                    ('Module', '`warns`', True),
-                    ('Action', '`enabled`', True),
-                ]
-            },
-            {
-                'title': '🤖 BFOS: Backup',
-                'color': 0x00AAFF,
-                'fields': [
-                    ('Executed By', f'{ctx.author.mention} (`{ctx.author.id}`)', True),
-                    ('Backup', '`ABC123`', True),
-                    ('Action', '`created`', True),
-                ]
-            },
-        ]
+        examples = _LOG_EXAMPLE_TEMPLATES
         
-        # Send examples with delay to avoid rate limits
+        # One timestamp for the whole dump, and the caller's strings built once
+        now = discord.utils.utcnow()
+        am = ctx.author.mention
+        aid = ctx.author.id
+        atag = f'{am} (`{aid}`)'
+        cm = ctx.channel.mention
+        
+        embeds = []
         for i, ex in enumerate(examples):
             embed = discord.Embed(
                 title=ex['title'],
                 color=ex['color'],
-                timestamp=datetime.utcnow()
+                timestamp=now
             )
             
             for name, value, inline in ex['fields']:
+                if '{' in value:
+                    value = value.format(author_tag=atag, author=am, channel=cm)
                 embed.add_field(name=name, value=value, inline=inline)
             
             embed.set_footer(text=f"Example {i+1}/{len(examples)}")
-            
-            await ctx.send(embed=embed)
-            await asyncio.sleep(1)  # 1 second delay between embeds
+            embeds.append(embed)
+        
+        # Channels allow 5 messages per 5 seconds - send in bursts of 5 (in order,
+        # so the numbering stays readable) and only wait between bursts
+        for start in range(0, len(embeds), _EXAMPLE_BURST):
+            if start:
+                await asyncio.sleep(_EXAMPLE_BURST_DELAY)
+            for embed in embeds[start:start + _EXAMPLE_BURST]:
+                await ctx.send(embed=embed)
         
         await ctx.send(f"✅ **Sent {len(examples)} log embed examples!**")
 
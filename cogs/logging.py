@@ -6,28 +6,76 @@ Comprehensive server logging with clean, compact Sapphire-style embeds
 import discord
 from discord.ext import commands, tasks
 import asyncio
+import aiohttp
+import io
 from datetime import datetime, timedelta
 from typing import Optional, Union, List, Dict, Any
 import os
 import json
 import re
-from collections import deque
+import sqlite3
+import time
+import threading
+from collections import deque, OrderedDict
 from utils.database import Database
 
+# Statements used by LoggingModule on its long-lived connection; sqlite3
+# keeps them compiled in the connection's statement cache between calls.
+SQL_GET_CFG_ALL = 'SELECT log_type, enabled, channel_id FROM logging_config WHERE guild_id = ?'
+SQL_ENABLE_LOG = '''INSERT OR REPLACE INTO logging_config (guild_id, log_type, enabled, channel_id)
+    VALUES (?, ?, ?, COALESCE((SELECT channel_id FROM logging_config WHERE guild_id = ? AND log_type = ?), NULL))'''
+SQL_SET_CHANNEL = '''INSERT OR REPLACE INTO logging_config (guild_id, log_type, enabled, channel_id)
+    VALUES (?, ?, COALESCE((SELECT enabled FROM logging_config WHERE guild_id = ? AND log_type = ?), 1), ?)'''
+SQL_MAX_CASE = 'SELECT MAX(case_number) FROM logging_cases WHERE guild_id = ?'
+SQL_INSERT_CASE = '''INSERT INTO logging_cases 
+    (guild_id, case_number, case_type, user_id, user_name, moderator_id, moderator_name, reason, timestamp, extra_data)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'''
+SQL_WEBHOOK_GET = 'SELECT webhook_id, webhook_url, webhook_token FROM logging_webhooks WHERE guild_id = ? AND channel_id = ?'
+SQL_WEBHOOK_STORE = '''INSERT OR REPLACE INTO logging_webhooks (guild_id, channel_id, webhook_id, webhook_url, webhook_token)
+    VALUES (?, ?, ?, ?, ?)'''
+SQL_WEBHOOK_DELETE = 'DELETE FROM logging_webhooks WHERE guild_id = ? AND channel_id = ?'
+
+# Route for a log type with no logging_config row: disabled, no channel
+_NO_ROUTE = (False, None)
+# (color, heading) for a log type missing from COLORS
+_NO_META = (None, None)
+
 
 class LogQueue:
     """Rate-limited log queue with webhook support"""
-    def __init__(self, rate: int = 5):
-        self.queue = deque()
+    def __init__(self, rate: int = 5, maxsize: int = 10_000, on_webhook_gone=None):
+        # Bounded: once full, the oldest pending log is dropped for each new one
+        self.queue = deque(maxlen=maxsize)
+        self.dropped = 0
         self.rate = rate
         self.last_time = datetime.utcnow()
         self.count = 0
+        self._wakeup = asyncio.Event()
+        # Awaited with the channel when its cached webhook turns out to be deleted
+        self.on_webhook_gone = on_webhook_gone
 
     async def add(self, channel, embed, file=None, files=None, content=None, webhook=None):
+        if len(self.queue) == self.queue.maxlen:
+            self.dropped += 1
+            if self.dropped % 1000 == 1:
+                print(f"[LOGGING] Log queue full ({self.queue.maxlen}), dropped {self.dropped} oldest entries so far")
         self.queue.append({
             'channel': channel, 'embed': embed, 'file': file,
             'files': files, 'content': content, 'webhook': webhook
         })
+        self._wakeup.set()
+
+    async def run(self):
+        """Sleep until something is queued, then drain the queue at the configured rate"""
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self.queue:
+                await self.process()
+                if self.queue:
+                    # Rate budget used up; wait for the next one-second window
+                    elapsed = (datetime.utcnow() - self.last_time).total_seconds()
+                    await asyncio.sleep(max(0.0, 1 - elapsed))
 
     async def process(self):
         now = datetime.utcnow()
@@ -35,37 +83,55 @@ class LogQueue:
             self.count = 0
             self.last_time = now
 
-        while self.queue and self.count < self.rate:
-            data = self.queue.popleft()
-            try:
-                kwargs = {
-                    'embed': data['embed'],
-                    'allowed_mentions': discord.AllowedMentions.none()
-                }
-                if data.get('files'):
-                    kwargs['files'] = data['files']
-                elif data.get('file'):
-                    kwargs['file'] = data['file']
-                if data.get('content'):
-                    kwargs['content'] = data['content']
+        batch = []
+        while self.queue and self.count + len(batch) < self.rate:
+            batch.append(self.queue.popleft())
+        if not batch:
+            return
+        self.count += len(batch)
 
-                sent = False
-                # Try webhook first
-                if data.get('webhook'):
-                    try:
-                        await data['webhook'].send(**kwargs, username="BFOS Logs")
-                        sent = True
-                    except (discord.NotFound, discord.Forbidden, discord.HTTPException):
-                        sent = False
+        # Different webhooks/channels are independent routes, so send them
+        # concurrently; items for the same route stay in queue order.
+        routes = {}
+        for data in batch:
+            route = data['webhook'].id if data.get('webhook') else data['channel'].id
+            routes.setdefault(route, []).append(data)
+        await asyncio.gather(*(self._send_route(items) for items in routes.values()), return_exceptions=True)
 
-                # Fallback to channel.send
-                if not sent:
-                    await data['channel'].send(**kwargs)
+    async def _send_route(self, items):
+        for data in items:
+            await self._send_one(data)
 
-                self.count += 1
-            except:
-                pass
-            await asyncio.sleep(0.1)
+    async def _send_one(self, data):
+        try:
+            kwargs = {
+                'embed': data['embed'],
+                'allowed_mentions': discord.AllowedMentions.none()
+            }
+            if data.get('files'):
+                kwargs['files'] = data['files']
+            elif data.get('file'):
+                kwargs['file'] = data['file']
+            if data.get('content'):
+                kwargs['content'] = data['content']
+
+            sent = False
+            # Try webhook first
+            if data.get('webhook'):
+                try:
+                    await data['webhook'].send(**kwargs, username="BFOS Logs")
+                    sent = True
+                except (discord.NotFound, discord.Forbidden):
+                    if self.on_webhook_gone:
+                        await self.on_webhook_gone(data['channel'])
+                except discord.HTTPException:
+                    pass
+
+            # Fallback to channel.send
+            if not sent:
+                await data['channel'].send(**kwargs)
+        except:
+            pass
 
 
 class LoggingModule(commands.Cog):
@@ -152,183 +218,240 @@ class LoggingModule(commands.Cog):
         'verify_log': 0x2ECC71,
     }
     
+    # Embed heading for each log type with a fixed title
+    LOG_HEADINGS = {
+        'message_delete': "🗑️ Message Deleted",
+        'message_edit': "✏️ Message Edited",
+        'message_bulk_delete': "🗑️ Bulk Delete",
+        'member_join': "📥 Member Joined",
+        'member_leave': "📤 Member Left",
+        'member_nickname': "📝 Nickname Changed",
+        'member_role_update': "🏷️ Roles Updated",
+        'member_timeout': "⏰ Member Timed Out",
+        'member_ban': "🔨 Member Banned",
+        'member_unban': "🔓 Member Unbanned",
+        'role_create': "✨ Role Created",
+        'role_delete': "🗑️ Role Deleted",
+        'role_update': "⚙️ Role Updated",
+        'channel_create': "📁 Channel Created",
+        'channel_delete': "🗑️ Channel Deleted",
+        'channel_update': "⚙️ Channel Updated",
+        'channel_perms': "🔐 Permission Update",
+        'voice_join': "🔊 Voice Join",
+        'voice_leave': "🔇 Voice Leave",
+        'voice_move': "🔀 Voice Move",
+        'guild_update': "⚙️ Server Updated",
+        'invite_create': "🔗 Invite Created",
+        'invite_delete': "🗑️ Invite Deleted",
+        'mod_warn': "⚠️ Warning Issued",
+        'mod_ban': "🔨 User Banned",
+        'mod_kick': "👢 User Kicked",
+        'mod_mute': "🔇 User Muted",
+        'mod_unban': "🔓 User Unbanned",
+        'mod_unwarn': "📝 Warning Cleared",
+        'mod_purge': "🗑️ Messages Purged",
+    }
+    
+    # Permission names and their display labels never change, so build them once
+    _ALL_PERM_NAMES = tuple(p[0] for p in discord.Permissions())
+    _PERM_DISPLAY = {p: p.replace('_', ' ').title() for p in _ALL_PERM_NAMES}
+    
+    MESSAGE_CACHE_MAX = 50_000
+    AUDIT_CACHE_TTL = 10  # seconds a pushed audit log entry is considered fresh
+    AUDIT_WAIT = 0.5  # how long to wait for a pushed entry before asking the API
+    
     def __init__(self, bot):
         self.bot = bot
         self.db = Database()
-        self.log_queue = LogQueue()
-        self.message_cache = {}
-        self.process_queue.start()
+        self.log_queue = LogQueue(on_webhook_gone=self._invalidate_webhook)
+        self.message_cache = OrderedDict()  # oldest first, swept by sweep_message_cache
+        self._config_cache = {}  # {guild_id: {log_type: (enabled, channel_id)}}
+        # log_type -> (color, heading), so a listener resolves both with one lookup
+        self._log_meta = {lt: (color, self.LOG_HEADINGS.get(lt)) for lt, color in self.COLORS.items()}
+        # One long-lived connection for every logging query instead of a
+        # connect/close per call; the lock serialises access to it.
+        self._conn = sqlite3.connect(self.db.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA cache_size=-20000")
+        self._db_lock = threading.Lock()
+        self._queue_worker = asyncio.create_task(self._run_queue())
+        self.sweep_message_cache.start()
+        self._dl_session: Optional[aiohttp.ClientSession] = None
+        # Audit entries pushed by the gateway, keyed (guild_id, action) and
+        # (guild_id, action, target_id) -> (entry, monotonic time received)
+        self._audit_cache = {}
+        self._audit_waiters = {}  # {(guild_id, action): [Future]}
+        self._audit_inflight = {}  # {(guild_id, action): Task} for shared API fetches
         self._init_tables()
     
     def _init_tables(self):
         """Initialize logging tables"""
-        conn = self.db._get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''CREATE TABLE IF NOT EXISTS logging_config (
-            guild_id INTEGER, log_type TEXT, enabled INTEGER DEFAULT 0, channel_id INTEGER,
-            PRIMARY KEY (guild_id, log_type))''')
-        cursor.execute('''CREATE TABLE IF NOT EXISTS logging_cases (
-            id INTEGER PRIMARY KEY, guild_id INTEGER, case_number INTEGER, case_type TEXT,
-            user_id INTEGER, user_name TEXT, moderator_id INTEGER, moderator_name TEXT,
-            reason TEXT, timestamp TEXT, extra_data TEXT)''')
-        cursor.execute('''CREATE TABLE IF NOT EXISTS logging_webhooks (
-            guild_id INTEGER, channel_id INTEGER,
-            webhook_id INTEGER, webhook_url TEXT, webhook_token TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            PRIMARY KEY (guild_id, channel_id))''')
-        conn.commit()
-        conn.close()
+        with self._db_lock:
+            self._conn.execute('''CREATE TABLE IF NOT EXISTS logging_config (
+                guild_id INTEGER, log_type TEXT, enabled INTEGER DEFAULT 0, channel_id INTEGER,
+                PRIMARY KEY (guild_id, log_type))''')
+            self._conn.execute('''CREATE TABLE IF NOT EXISTS logging_cases (
+                id INTEGER PRIMARY KEY, guild_id INTEGER, case_number INTEGER, case_type TEXT,
+                user_id INTEGER, user_name TEXT, moderator_id INTEGER, moderator_name TEXT,
+                reason TEXT, timestamp TEXT, extra_data TEXT)''')
+            self._conn.execute('''CREATE TABLE IF NOT EXISTS logging_webhooks (
+                guild_id INTEGER, channel_id INTEGER,
+                webhook_id INTEGER, webhook_url TEXT, webhook_token TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (guild_id, channel_id))''')
+            self._conn.commit()
         self._webhook_cache = {}  # {(guild_id, channel_id): discord.Webhook}
     
-    def cog_unload(self):
-        self.process_queue.cancel()
+    def _fetchone(self, sql: str, params: tuple = ()):
+        with self._db_lock:
+            return self._conn.execute(sql, params).fetchone()
+    
+    def _fetchall(self, sql: str, params: tuple = ()):
+        with self._db_lock:
+            return self._conn.execute(sql, params).fetchall()
     
-    @tasks.loop(seconds=1)
-    async def process_queue(self):
-        await self.log_queue.process()
+    def _write(self, sql: str, params: tuple = ()):
+        with self._db_lock:
+            self._conn.execute(sql, params)
+            self._conn.commit()
     
-    @process_queue.before_loop
-    async def before_process_queue(self):
+    async def cog_unload(self):
+        self._queue_worker.cancel()
+        self.sweep_message_cache.cancel()
+        # Wait out any query still running in a worker thread before closing
+        with self._db_lock:
+            self._conn.close()
+        if self._dl_session and not self._dl_session.closed:
+            await self._dl_session.close()
+    
+    async def _run_queue(self):
         await self.bot.wait_until_ready()
+        await self.log_queue.run()
+    
+    @tasks.loop(minutes=5)
+    async def sweep_message_cache(self):
+        """Drop cached messages older than an hour"""
+        cutoff = datetime.utcnow() - timedelta(hours=1)
+        cache = self.message_cache
+        while cache and next(iter(cache.values()))['time'] < cutoff:
+            cache.popitem(last=False)
     
     # ==================== CONFIG METHODS ====================
     
+    def _read_config(self, guild_id: int) -> Dict[str, tuple]:
+        rows = self._fetchall(SQL_GET_CFG_ALL, (guild_id,))
+        return {row[0]: (bool(row[1]), row[2]) for row in rows}
+    
+    def _load_config(self, guild_id: int) -> Dict[str, tuple]:
+        """Load every log type for a guild into the config cache with one query"""
+        cfg = self._read_config(guild_id)
+        self._config_cache[guild_id] = cfg
+        return cfg
+    
+    def _get_config(self, guild_id: int) -> Dict[str, tuple]:
+        cfg = self._config_cache.get(guild_id)
+        if cfg is None:
+            cfg = self._load_config(guild_id)
+        return cfg
+    
+    async def _get_config_async(self, guild_id: int) -> Dict[str, tuple]:
+        """Same as _get_config, but a cache miss is read off the event loop"""
+        cfg = self._config_cache.get(guild_id)
+        if cfg is None:
+            cfg = await asyncio.to_thread(self._read_config, guild_id)
+            # A config write may have filled the cache while we were reading
+            cfg = self._config_cache.setdefault(guild_id, cfg)
+        return cfg
+    
+    async def _get_log_route(self, guild_id: int, log_type: str) -> tuple:
+        """(enabled, channel_id) for a log type in one lookup"""
+        return (await self._get_config_async(guild_id)).get(log_type, _NO_ROUTE)
+    
+    async def _log_enabled(self, guild_id: int, log_type: str) -> bool:
+        return (await self._get_log_route(guild_id, log_type))[0]
+    
     def is_log_type_enabled(self, guild_id: int, log_type: str) -> bool:
-        conn = self.db._get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT enabled FROM logging_config WHERE guild_id = ? AND log_type = ?', (guild_id, log_type))
-        row = cursor.fetchone()
-        conn.close()
-        return bool(row and row[0])
+        return self._get_config(guild_id).get(log_type, _NO_ROUTE)[0]
     
     def get_log_channel(self, guild_id: int, log_type: str) -> Optional[int]:
-        conn = self.db._get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT channel_id FROM logging_config WHERE guild_id = ? AND log_type = ?', (guild_id, log_type))
-        row = cursor.fetchone()
-        conn.close()
-        return row[0] if row else None
+        return self._get_config(guild_id).get(log_type, _NO_ROUTE)[1]
     
     def enable_log_type(self, guild_id: int, log_type: str, enabled: bool = True):
-        conn = self.db._get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''INSERT OR REPLACE INTO logging_config (guild_id, log_type, enabled, channel_id)
-            VALUES (?, ?, ?, COALESCE((SELECT channel_id FROM logging_config WHERE guild_id = ? AND log_type = ?), NULL))''',
-            (guild_id, log_type, int(enabled), guild_id, log_type))
-        conn.commit()
-        conn.close()
+        self._write(SQL_ENABLE_LOG, (guild_id, log_type, int(enabled), guild_id, log_type))
+        cfg = self._get_config(guild_id)
+        cfg[log_type] = (bool(enabled), cfg.get(log_type, _NO_ROUTE)[1])
     
     def set_log_channel(self, guild_id: int, log_type: str, channel_id: int):
-        conn = self.db._get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''INSERT OR REPLACE INTO logging_config (guild_id, log_type, enabled, channel_id)
-            VALUES (?, ?, COALESCE((SELECT enabled FROM logging_config WHERE guild_id = ? AND log_type = ?), 1), ?)''',
-            (guild_id, log_type, guild_id, log_type, channel_id))
-        conn.commit()
-        conn.close()
+        self._write(SQL_SET_CHANNEL, (guild_id, log_type, guild_id, log_type, channel_id))
+        cfg = self._get_config(guild_id)
+        cfg[log_type] = (cfg.get(log_type, (True, None))[0], channel_id)
     
     def get_all_config(self, guild_id: int) -> Dict:
-        conn = self.db._get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT log_type, enabled, channel_id FROM logging_config WHERE guild_id = ?', (guild_id,))
-        rows = cursor.fetchall()
-        conn.close()
-        return {row[0]: {'enabled': bool(row[1]), 'channel_id': row[2]} for row in rows}
+        return {log_type: {'enabled': enabled, 'channel_id': channel_id}
+                for log_type, (enabled, channel_id) in self._get_config(guild_id).items()}
     
     # ==================== CASE SYSTEM ====================
     
     def get_next_case_number(self, guild_id: int) -> int:
-        conn = self.db._get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT MAX(case_number) FROM logging_cases WHERE guild_id = ?', (guild_id,))
-        row = cursor.fetchone()
-        conn.close()
+        row = self._fetchone(SQL_MAX_CASE, (guild_id,))
         return (row[0] or 0) + 1
     
     def create_case(self, guild_id: int, case_type: str, user_id: int, user_name: str,
                     mod_id: int, mod_name: str, reason: str = None, extra: dict = None) -> int:
-        case_num = self.get_next_case_number(guild_id)
-        conn = self.db._get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''INSERT INTO logging_cases 
-            (guild_id, case_number, case_type, user_id, user_name, moderator_id, moderator_name, reason, timestamp, extra_data)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
-            (guild_id, case_num, case_type, user_id, user_name, mod_id, mod_name, reason, datetime.utcnow().isoformat(), json.dumps(extra) if extra else None))
-        conn.commit()
-        conn.close()
+        # Read and insert under one lock hold and one transaction, so two cases
+        # created from worker threads at once can't take the same number
+        with self._db_lock, self._conn:
+            row = self._conn.execute(SQL_MAX_CASE, (guild_id,)).fetchone()
+            case_num = (row[0] or 0) + 1
+            self._conn.execute(SQL_INSERT_CASE,
+                (guild_id, case_num, case_type, user_id, user_name, mod_id, mod_name, reason, datetime.utcnow().isoformat(), json.dumps(extra) if extra else None))
         return case_num
     
     # ==================== WEBHOOK MANAGEMENT ====================
 
     def _get_stored_webhook(self, guild_id: int, channel_id: int):
         """Get stored webhook info from DB."""
-        conn = self.db._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            'SELECT webhook_id, webhook_url, webhook_token FROM logging_webhooks WHERE guild_id = ? AND channel_id = ?',
-            (guild_id, channel_id)
-        )
-        row = cursor.fetchone()
-        conn.close()
+        row = self._fetchone(SQL_WEBHOOK_GET, (guild_id, channel_id))
         if row:
             return {'id': row[0], 'url': row[1], 'token': row[2]}
         return None
 
     def _store_webhook(self, guild_id: int, channel_id: int, webhook: discord.Webhook):
         """Store webhook info in DB."""
-        conn = self.db._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            '''INSERT OR REPLACE INTO logging_webhooks (guild_id, channel_id, webhook_id, webhook_url, webhook_token)
-               VALUES (?, ?, ?, ?, ?)''',
-            (guild_id, channel_id, webhook.id, webhook.url, webhook.token)
-        )
-        conn.commit()
-        conn.close()
+        self._write(SQL_WEBHOOK_STORE, (guild_id, channel_id, webhook.id, webhook.url, webhook.token))
 
     def _delete_stored_webhook(self, guild_id: int, channel_id: int):
         """Remove stored webhook info from DB."""
-        conn = self.db._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            'DELETE FROM logging_webhooks WHERE guild_id = ? AND channel_id = ?',
-            (guild_id, channel_id)
-        )
-        conn.commit()
-        conn.close()
+        self._write(SQL_WEBHOOK_DELETE, (guild_id, channel_id))
         self._webhook_cache.pop((guild_id, channel_id), None)
 
+    async def _invalidate_webhook(self, channel):
+        """Forget a webhook that no longer works so the next log resolves a new one."""
+        await asyncio.to_thread(self._delete_stored_webhook, channel.guild.id, channel.id)
+
     async def _get_or_create_webhook(self, channel: discord.TextChannel) -> Optional[discord.Webhook]:
         """Get existing or create new BFOS Logs webhook for a channel."""
         cache_key = (channel.guild.id, channel.id)
 
-        # Check memory cache
-        if cache_key in self._webhook_cache:
-            webhook = self._webhook_cache[cache_key]
-            try:
-                await webhook.fetch()
-                return webhook
-            except (discord.NotFound, discord.Forbidden):
-                self._webhook_cache.pop(cache_key, None)
-                self._delete_stored_webhook(channel.guild.id, channel.id)
+        # Check memory cache; a stale webhook is caught when sending fails
+        webhook = self._webhook_cache.get(cache_key)
+        if webhook is not None:
+            return webhook
 
         # Check DB for stored webhook
-        stored = self._get_stored_webhook(channel.guild.id, channel.id)
+        stored = await asyncio.to_thread(self._get_stored_webhook, channel.guild.id, channel.id)
         if stored:
-            try:
-                webhook = discord.Webhook.partial(stored['id'], stored['token'], session=self.bot.http._HTTPClient__session)
-                test = await webhook.fetch()
-                self._webhook_cache[cache_key] = test
-                return test
-            except (discord.NotFound, discord.Forbidden):
-                self._delete_stored_webhook(channel.guild.id, channel.id)
+            webhook = discord.Webhook.partial(stored['id'], stored['token'], session=self.bot.http._HTTPClient__session)
+            self._webhook_cache[cache_key] = webhook
+            return webhook
 
         # Check channel for existing "BFOS Logs" webhook
         try:
             webhooks = await channel.webhooks()
             for wh in webhooks:
                 if wh.name == "BFOS Logs" and wh.user and wh.user.id == self.bot.user.id:
-                    self._store_webhook(channel.guild.id, channel.id, wh)
+                    await asyncio.to_thread(self._store_webhook, channel.guild.id, channel.id, wh)
                     self._webhook_cache[cache_key] = wh
                     return wh
         except discord.Forbidden:
@@ -340,7 +463,7 @@ class LoggingModule(commands.Cog):
             if self.bot.user.avatar:
                 avatar_bytes = await self.bot.user.avatar.read()
             webhook = await channel.create_webhook(name="BFOS Logs", avatar=avatar_bytes)
-            self._store_webhook(channel.guild.id, channel.id, webhook)
+            await asyncio.to_thread(self._store_webhook, channel.guild.id, channel.id, webhook)
             self._webhook_cache[cache_key] = webhook
             return webhook
         except (discord.Forbidden, discord.HTTPException):
@@ -349,24 +472,60 @@ class LoggingModule(commands.Cog):
     # ==================== LOG SENDING ====================
 
     async def send_log(self, guild: discord.Guild, log_type: str, embed: discord.Embed, file=None, files=None):
-        if not self.is_log_type_enabled(guild.id, log_type):
-            return
-        channel_id = self.get_log_channel(guild.id, log_type)
-        if not channel_id:
+        enabled, channel_id = await self._get_log_route(guild.id, log_type)
+        if not enabled or not channel_id:
             return
         channel = guild.get_channel(channel_id)
         if channel:
             webhook = await self._get_or_create_webhook(channel)
             await self.log_queue.add(channel, embed, file=file, files=files, webhook=webhook)
     
+    async def _should_log(self, guild: discord.Guild, log_type: str) -> bool:
+        """Whether send_log would deliver this log type; checked before building any embed"""
+        enabled, channel_id = await self._get_log_route(guild.id, log_type)
+        return enabled and bool(channel_id)
+    
     # ==================== EMBED HELPERS ====================
     
-    def make_embed(self, title: str, color: int, description: str = None) -> discord.Embed:
-        embed = discord.Embed(title=title, color=color, timestamp=datetime.utcnow())
+    def make_embed(self, title: str, color: int, description: str = None, timestamp: datetime = None) -> discord.Embed:
+        embed = discord.Embed(title=title, color=color, timestamp=timestamp or datetime.utcnow())
         if description:
             embed.description = description
         return embed
     
+    def make_log_embed(self, log_type: str, description: str = None, timestamp: datetime = None) -> discord.Embed:
+        color, heading = self._log_meta[log_type]
+        return self.make_embed(heading, color, description, timestamp)
+    
+    async def _emit(self, guild: discord.Guild, log_type: str, fields, *, title: str = None, color: int = None,
+                    description: str = None, author=None, thumbnail=None, footer: str = None,
+                    file=None, files=None, now: datetime = None):
+        """Build a fixed-shape log embed straight from its payload and queue it.
+
+        fields is a sequence of (name, value, inline); author and thumbnail take
+        a user/member whose name and avatar are used. title and color default
+        to the log type's heading and color.
+        """
+        meta_color, heading = self._log_meta.get(log_type, _NO_META)
+        payload = {
+            'type': 'rich',
+            'title': heading if title is None else title,
+            'color': meta_color if color is None else color,
+            'timestamp': (now or datetime.utcnow()).isoformat(),
+            'fields': [{'name': name, 'value': value, 'inline': inline} for name, value, inline in fields],
+        }
+        if description:
+            payload['description'] = description
+        if author is not None:
+            payload['author'] = {'name': str(author)}
+            if author.display_avatar:
+                payload['author']['icon_url'] = author.display_avatar.url
+        if thumbnail is not None and thumbnail.display_avatar:
+            payload['thumbnail'] = {'url': thumbnail.display_avatar.url}
+        if footer:
+            payload['footer'] = {'text': footer}
+        await self.send_log(guild, log_type, discord.Embed.from_dict(payload), file=file, files=files)
+    
     def format_user(self, user: Union[discord.User, discord.Member]) -> str:
         return f"{user.mention} (`{user.id}`)"
     
@@ -380,15 +539,12 @@ class LoggingModule(commands.Cog):
         """Format permission changes compactly"""
         changes = []
         
-        # Get all permission names
-        all_perms = [p[0] for p in discord.Permissions()]
-        
-        for perm in all_perms:
+        for perm in self._ALL_PERM_NAMES:
             before_val = getattr(before_perms, perm, None)
             after_val = getattr(after_perms, perm, None)
             
             if before_val != after_val:
-                perm_name = perm.replace('_', ' ').title()
+                perm_name = self._PERM_DISPLAY[perm]
                 if after_val is True:
                     changes.append(f"✅ {perm_name}")
                 elif after_val is False:
@@ -398,20 +554,100 @@ class LoggingModule(commands.Cog):
         
         return "\n".join(changes[:15]) if changes else "No changes"
     
-    def get_audit_entry(self, guild: discord.Guild, action, target_id: int = None):
+    def _cached_audit_entry(self, guild_id: int, action, target_id: int = None):
+        key = (guild_id, action) if target_id is None else (guild_id, action, target_id)
+        hit = self._audit_cache.get(key)
+        if hit and time.monotonic() - hit[1] < self.AUDIT_CACHE_TTL:
+            return hit[0]
+        return None
+    
+    def get_audit_entry(self, guild: discord.Guild, action, target_id: int = None, now: datetime = None):
         """Helper to get audit log entry"""
         async def _get():
-            try:
-                await asyncio.sleep(0.5)
-                async for entry in guild.audit_logs(limit=5, action=action):
-                    if target_id is None or entry.target.id == target_id:
-                        if (datetime.utcnow() - entry.created_at.replace(tzinfo=None)).total_seconds() < 10:
-                            return entry
-            except:
-                pass
+            entry = self._cached_audit_entry(guild.id, action, target_id)
+            if entry:
+                return entry
+            
+            # The gateway usually pushes the audit entry just after the event
+            # itself, so wait briefly for it before falling back to the API
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.AUDIT_WAIT
+            key = (guild.id, action)
+            while (remaining := deadline - loop.time()) > 0:
+                fut = loop.create_future()
+                waiters = self._audit_waiters.setdefault(key, [])
+                waiters.append(fut)
+                try:
+                    await asyncio.wait_for(fut, remaining)
+                except asyncio.TimeoutError:
+                    break
+                finally:
+                    if fut in waiters:
+                        waiters.remove(fut)
+                    if not waiters and self._audit_waiters.get(key) is waiters:
+                        del self._audit_waiters[key]
+                entry = self._cached_audit_entry(guild.id, action, target_id)
+                if entry:
+                    return entry
+            
+            ref = now or datetime.utcnow()
+            for entry in await self._fetch_audit_entries(guild, action):
+                if target_id is None or getattr(entry.target, 'id', None) == target_id:
+                    if (ref - entry.created_at.replace(tzinfo=None)).total_seconds() < 10:
+                        return entry
             return None
         return _get()
     
+    async def _fetch_audit_entries(self, guild: discord.Guild, action) -> list:
+        """Recent audit entries for an action, with one API call shared by concurrent callers"""
+        key = (guild.id, action)
+        task = self._audit_inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._list_audit_entries(guild, action))
+            self._audit_inflight[key] = task
+            task.add_done_callback(lambda _: self._audit_inflight.pop(key, None))
+        # shield so one caller being cancelled doesn't cancel everyone's fetch
+        return await asyncio.shield(task)
+    
+    async def _list_audit_entries(self, guild: discord.Guild, action) -> list:
+        try:
+            return [entry async for entry in guild.audit_logs(limit=5, action=action)]
+        except:
+            return []
+    
+    @commands.Cog.listener()
+    async def on_audit_log_entry_create(self, entry):
+        received = time.monotonic()
+        guild_id = entry.guild.id
+        self._audit_cache[(guild_id, entry.action)] = (entry, received)
+        target_id = getattr(entry.target, 'id', None)
+        if target_id is not None:
+            self._audit_cache[(guild_id, entry.action, target_id)] = (entry, received)
+        
+        if len(self._audit_cache) > 5000:
+            cutoff = received - self.AUDIT_CACHE_TTL
+            self._audit_cache = {k: v for k, v in self._audit_cache.items() if v[1] >= cutoff}
+        
+        for fut in self._audit_waiters.pop((guild_id, entry.action), ()):
+            if not fut.done():
+                fut.set_result(None)
+    
+    async def _session(self) -> aiohttp.ClientSession:
+        """Shared session for attachment downloads, created on first use"""
+        if self._dl_session is None or self._dl_session.closed:
+            self._dl_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=64, ttl_dns_cache=300)
+            )
+        return self._dl_session
+    
+    async def _download_attachment(self, session: aiohttp.ClientSession, attachment) -> Optional[discord.File]:
+        async with session.get(attachment.url) as resp:
+            if resp.status == 200:
+                data = await resp.read()
+                if len(data) < 8_000_000:  # 8MB limit
+                    return discord.File(io.BytesIO(data), filename=attachment.filename)
+        return None
+    
     # ==================== MESSAGE EVENTS ====================
     
     @commands.Cog.listener()
@@ -425,16 +661,19 @@ class LoggingModule(commands.Cog):
                 'attachments': [{'name': a.filename, 'url': a.url} for a in message.attachments],
                 'time': datetime.utcnow()
             }
-            # Clean old cache
-            cutoff = datetime.utcnow() - timedelta(hours=1)
-            self.message_cache = {k: v for k, v in self.message_cache.items() if v.get('time', datetime.utcnow()) > cutoff}
+            self.message_cache.move_to_end(message.id)
+            if len(self.message_cache) > self.MESSAGE_CACHE_MAX:
+                self.message_cache.popitem(last=False)
     
     @commands.Cog.listener()
     async def on_message_delete(self, message):
         if not message.guild or message.author.bot:
             return
+        if not await self._should_log(message.guild, 'message_delete'):
+            return
+        now = datetime.utcnow()
         
-        embed = self.make_embed("🗑️ Message Deleted", self.COLORS['message_delete'])
+        embed = self.make_log_embed('message_delete', timestamp=now)
         embed.set_author(name=str(message.author), icon_url=message.author.display_avatar.url if message.author.display_avatar else None)
         
         embed.add_field(name="Author", value=self.format_user(message.author), inline=True)
@@ -446,7 +685,7 @@ class LoggingModule(commands.Cog):
             embed.add_field(name="Content", value=f"```\n{content}\n```", inline=False)
         
         # Get deleter from audit log
-        entry = await self.get_audit_entry(message.guild, discord.AuditLogAction.message_delete, message.author.id)
+        entry = await self.get_audit_entry(message.guild, discord.AuditLogAction.message_delete, message.author.id, now=now)
         if entry:
             embed.add_field(name="Deleted By", value=self.format_user(entry.user), inline=True)
         
@@ -462,20 +701,12 @@ class LoggingModule(commands.Cog):
         # Handle attachments - download and re-upload
         attachment_files = []
         if message.attachments:
-            import aiohttp
-            import io
-            
-            for attachment in message.attachments[:3]:  # Limit to 3 files
-                try:
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(attachment.url) as resp:
-                            if resp.status == 200:
-                                data = await resp.read()
-                                if len(data) < 8_000_000:  # 8MB limit
-                                    file = discord.File(io.BytesIO(data), filename=attachment.filename)
-                                    attachment_files.append(file)
-                except:
-                    pass
+            session = await self._session()
+            results = await asyncio.gather(
+                *(self._download_attachment(session, a) for a in message.attachments[:3]),  # Limit to 3 files
+                return_exceptions=True
+            )
+            attachment_files = [f for f in results if isinstance(f, discord.File)]
             
             if not attachment_files:
                 # Couldn't download, just list them
@@ -487,44 +718,44 @@ class LoggingModule(commands.Cog):
     async def on_message_edit(self, before, after):
         if not before.guild or before.author.bot or before.content == after.content:
             return
-        
-        embed = self.make_embed("✏️ Message Edited", self.COLORS['message_edit'])
-        embed.set_author(name=str(before.author), icon_url=before.author.display_avatar.url if before.author.display_avatar else None)
-        
-        embed.add_field(name="Author", value=self.format_user(before.author), inline=True)
-        embed.add_field(name="Channel", value=self.format_channel(before.channel), inline=True)
-        embed.add_field(name="Jump", value=f"[Click]({after.jump_url})", inline=True)
+        if not await self._should_log(before.guild, 'message_edit'):
+            return
         
         before_text = (before.content[:400] + "...") if len(before.content or "") > 400 else (before.content or "*empty*")
         after_text = (after.content[:400] + "...") if len(after.content or "") > 400 else (after.content or "*empty*")
         
-        embed.add_field(name="Before", value=f"```\n{before_text}\n```", inline=False)
-        embed.add_field(name="After", value=f"```\n{after_text}\n```", inline=False)
-        
-        embed.set_footer(text=f"Author: {before.author.id} • Message: {before.id}")
-        await self.send_log(before.guild, 'message_edit', embed)
+        await self._emit(before.guild, 'message_edit', (
+            ("Author", self.format_user(before.author), True),
+            ("Channel", self.format_channel(before.channel), True),
+            ("Jump", f"[Click]({after.jump_url})", True),
+            ("Before", f"```\n{before_text}\n```", False),
+            ("After", f"```\n{after_text}\n```", False),
+        ), author=before.author, footer=f"Author: {before.author.id} • Message: {before.id}")
     
     @commands.Cog.listener()
     async def on_bulk_message_delete(self, messages):
         if not messages:
             return
         guild = messages[0].guild
-        if not guild:
+        if not guild or not await self._should_log(guild, 'message_bulk_delete'):
             return
+        now = datetime.utcnow()
         
-        embed = self.make_embed("🗑️ Bulk Delete", self.COLORS['message_bulk_delete'], 
-                                f"**{len(messages)}** messages deleted in {messages[0].channel.mention}")
+        embed = self.make_log_embed('message_bulk_delete',
+                                    f"**{len(messages)}** messages deleted in {messages[0].channel.mention}", timestamp=now)
         
         # Create log file
-        log_content = f"Bulk Delete Log - {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
-        log_content += f"Channel: #{messages[0].channel.name} ({messages[0].channel.id})\n"
-        log_content += f"Messages: {len(messages)}\n\n"
-        
-        for msg in sorted(messages, key=lambda m: m.created_at):
-            log_content += f"[{msg.created_at.strftime('%H:%M:%S')}] {msg.author}: {msg.content or '[no content]'}\n"
-        
-        import io
-        file = discord.File(io.BytesIO(log_content.encode()), filename=f"bulk_delete_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.txt")
+        parts = [
+            f"Bulk Delete Log - {now.strftime('%Y-%m-%d %H:%M:%S UTC')}",
+            f"Channel: #{messages[0].channel.name} ({messages[0].channel.id})",
+            f"Messages: {len(messages)}",
+            "",
+        ]
+        parts.extend(f"[{msg.created_at.strftime('%H:%M:%S')}] {msg.author}: {msg.content or '[no content]'}"
+                     for msg in sorted(messages, key=lambda m: m.created_at))
+        log_content = "\n".join(parts) + "\n"
+        
+        file = discord.File(io.BytesIO(log_content.encode()), filename=f"bulk_delete_{now.strftime('%Y%m%d_%H%M%S')}.txt")
         
         embed.add_field(name="Channel", value=self.format_channel(messages[0].channel), inline=True)
         embed.add_field(name="Count", value=str(len(messages)), inline=True)
@@ -536,165 +767,169 @@ class LoggingModule(commands.Cog):
     
     @commands.Cog.listener()
     async def on_member_join(self, member):
-        embed = self.make_embed("📥 Member Joined", self.COLORS['member_join'])
-        embed.set_author(name=str(member), icon_url=member.display_avatar.url if member.display_avatar else None)
-        embed.set_thumbnail(url=member.display_avatar.url if member.display_avatar else None)
-        
-        embed.add_field(name="User", value=self.format_user(member), inline=True)
-        embed.add_field(name="Created", value=f"<t:{int(member.created_at.timestamp())}:R>", inline=True)
+        if not await self._should_log(member.guild, 'member_join'):
+            return
+        now = datetime.utcnow()
+        fields = [
+            ("User", self.format_user(member), True),
+            ("Created", f"<t:{int(member.created_at.timestamp())}:R>", True),
+        ]
         
         # Account age warning
-        age = (datetime.utcnow() - member.created_at.replace(tzinfo=None)).days
+        age = (now - member.created_at.replace(tzinfo=None)).days
         if age < 7:
-            embed.add_field(name="⚠️ New Account", value=f"{age} days old", inline=True)
+            fields.append(("⚠️ New Account", f"{age} days old", True))
         
-        embed.add_field(name="Member #", value=str(member.guild.member_count), inline=True)
-        embed.set_footer(text=f"User ID: {member.id}")
-        
-        await self.send_log(member.guild, 'member_join', embed)
+        fields.append(("Member #", str(member.guild.member_count), True))
+        await self._emit(member.guild, 'member_join', fields,
+                         author=member, thumbnail=member, now=now, footer=f"User ID: {member.id}")
     
     @commands.Cog.listener()
     async def on_member_remove(self, member):
-        embed = self.make_embed("📤 Member Left", self.COLORS['member_leave'])
-        embed.set_author(name=str(member), icon_url=member.display_avatar.url if member.display_avatar else None)
-        embed.set_thumbnail(url=member.display_avatar.url if member.display_avatar else None)
-        
-        embed.add_field(name="User", value=self.format_user(member), inline=True)
-        embed.add_field(name="Joined", value=f"<t:{int(member.joined_at.timestamp())}:R>" if member.joined_at else "Unknown", inline=True)
+        if not await self._should_log(member.guild, 'member_leave'):
+            return
+        now = datetime.utcnow()
+        fields = [
+            ("User", self.format_user(member), True),
+            ("Joined", f"<t:{int(member.joined_at.timestamp())}:R>" if member.joined_at else "Unknown", True),
+        ]
         
         if member.roles[1:]:
-            roles = ", ".join(r.mention for r in member.roles[1:][:10])
-            embed.add_field(name="Roles", value=roles, inline=False)
+            fields.append(("Roles", ", ".join(r.mention for r in member.roles[1:][:10]), False))
         
         # Check if kicked/banned
-        entry = await self.get_audit_entry(member.guild, discord.AuditLogAction.kick, member.id)
+        entry = await self.get_audit_entry(member.guild, discord.AuditLogAction.kick, member.id, now=now)
         if entry:
-            embed.add_field(name="Kicked By", value=self.format_user(entry.user), inline=True)
+            fields.append(("Kicked By", self.format_user(entry.user), True))
             if entry.reason:
-                embed.add_field(name="Reason", value=entry.reason[:200], inline=False)
+                fields.append(("Reason", entry.reason[:200], False))
         
-        embed.set_footer(text=f"User ID: {member.id}")
-        await self.send_log(member.guild, 'member_leave', embed)
+        await self._emit(member.guild, 'member_leave', fields,
+                         author=member, thumbnail=member, now=now, footer=f"User ID: {member.id}")
     
     @commands.Cog.listener()
     async def on_member_update(self, before, after):
+        footer = f"User ID: {after.id}"
+        now = datetime.utcnow()
+        
         # Nickname change
-        if before.nick != after.nick:
-            embed = self.make_embed("📝 Nickname Changed", self.COLORS['member_nickname'])
-            embed.set_author(name=str(after), icon_url=after.display_avatar.url if after.display_avatar else None)
-            embed.add_field(name="User", value=self.format_user(after), inline=True)
-            embed.add_field(name="Before", value=f"`{before.nick or 'None'}`", inline=True)
-            embed.add_field(name="After", value=f"`{after.nick or 'None'}`", inline=True)
-            embed.set_footer(text=f"User ID: {after.id}")
-            await self.send_log(after.guild, 'member_nickname', embed)
+        if before.nick != after.nick and await self._should_log(after.guild, 'member_nickname'):
+            await self._emit(after.guild, 'member_nickname', (
+                ("User", self.format_user(after), True),
+                ("Before", f"`{before.nick or 'None'}`", True),
+                ("After", f"`{after.nick or 'None'}`", True),
+            ), author=after, now=now, footer=footer)
         
         # Role changes
-        if before.roles != after.roles:
+        if before.roles != after.roles and await self._should_log(after.guild, 'member_role_update'):
             added = [r for r in after.roles if r not in before.roles]
             removed = [r for r in before.roles if r not in after.roles]
             
             if added or removed:
-                embed = self.make_embed("🏷️ Roles Updated", self.COLORS['member_role_update'])
-                embed.set_author(name=str(after), icon_url=after.display_avatar.url if after.display_avatar else None)
-                embed.add_field(name="User", value=self.format_user(after), inline=True)
-                
+                fields = [("User", self.format_user(after), True)]
                 if added:
-                    embed.add_field(name="➕ Added", value=" ".join(r.mention for r in added[:10]), inline=False)
+                    fields.append(("➕ Added", " ".join(r.mention for r in added[:10]), False))
                 if removed:
-                    embed.add_field(name="➖ Removed", value=" ".join(r.mention for r in removed[:10]), inline=False)
+                    fields.append(("➖ Removed", " ".join(r.mention for r in removed[:10]), False))
                 
                 # Get who did it
-                entry = await self.get_audit_entry(after.guild, discord.AuditLogAction.member_role_update, after.id)
+                entry = await self.get_audit_entry(after.guild, discord.AuditLogAction.member_role_update, after.id, now=now)
                 if entry:
-                    embed.add_field(name="By", value=self.format_user(entry.user), inline=True)
+                    fields.append(("By", self.format_user(entry.user), True))
                 
-                embed.set_footer(text=f"User ID: {after.id}")
-                await self.send_log(after.guild, 'member_role_update', embed)
+                await self._emit(after.guild, 'member_role_update', fields,
+                                 author=after, now=now, footer=footer)
         
         # Timeout change
-        if before.timed_out_until != after.timed_out_until:
+        if before.timed_out_until != after.timed_out_until and await self._should_log(after.guild, 'member_timeout'):
+            fields = [("User", self.format_user(after), True)]
             if after.timed_out_until:
-                embed = self.make_embed("⏰ Member Timed Out", self.COLORS['member_timeout'])
-                embed.add_field(name="User", value=self.format_user(after), inline=True)
-                embed.add_field(name="Until", value=f"<t:{int(after.timed_out_until.timestamp())}:R>", inline=True)
+                title, color = None, None
+                fields.append(("Until", f"<t:{int(after.timed_out_until.timestamp())}:R>", True))
             else:
-                embed = self.make_embed("✅ Timeout Removed", 0x27AE60)
-                embed.add_field(name="User", value=self.format_user(after), inline=True)
+                title, color = "✅ Timeout Removed", 0x27AE60
             
-            entry = await self.get_audit_entry(after.guild, discord.AuditLogAction.member_update, after.id)
+            entry = await self.get_audit_entry(after.guild, discord.AuditLogAction.member_update, after.id, now=now)
             if entry:
-                embed.add_field(name="By", value=self.format_user(entry.user), inline=True)
+                fields.append(("By", self.format_user(entry.user), True))
                 if entry.reason:
-                    embed.add_field(name="Reason", value=entry.reason[:200], inline=False)
+                    fields.append(("Reason", entry.reason[:200], False))
             
-            embed.set_footer(text=f"User ID: {after.id}")
-            await self.send_log(after.guild, 'member_timeout', embed)
+            await self._emit(after.guild, 'member_timeout', fields, title=title, color=color, now=now, footer=footer)
     
     @commands.Cog.listener()
     async def on_member_ban(self, guild, user):
-        embed = self.make_embed("🔨 Member Banned", self.COLORS['member_ban'])
-        embed.set_author(name=str(user), icon_url=user.display_avatar.url if user.display_avatar else None)
-        embed.set_thumbnail(url=user.display_avatar.url if user.display_avatar else None)
-        
-        embed.add_field(name="User", value=self.format_user(user), inline=True)
+        if not await self._should_log(guild, 'member_ban'):
+            return
+        now = datetime.utcnow()
+        fields = [("User", self.format_user(user), True)]
         
-        entry = await self.get_audit_entry(guild, discord.AuditLogAction.ban, user.id)
+        entry = await self.get_audit_entry(guild, discord.AuditLogAction.ban, user.id, now=now)
         if entry:
-            embed.add_field(name="Banned By", value=self.format_user(entry.user), inline=True)
+            fields.append(("Banned By", self.format_user(entry.user), True))
             if entry.reason:
-                embed.add_field(name="Reason", value=f"```\n{entry.reason[:500]}\n```", inline=False)
+                fields.append(("Reason", f"```\n{entry.reason[:500]}\n```", False))
         
-        embed.set_footer(text=f"User ID: {user.id}")
-        await self.send_log(guild, 'member_ban', embed)
+        await self._emit(guild, 'member_ban', fields,
+                         author=user, thumbnail=user, now=now, footer=f"User ID: {user.id}")
     
     @commands.Cog.listener()
     async def on_member_unban(self, guild, user):
-        embed = self.make_embed("🔓 Member Unbanned", self.COLORS['member_unban'])
-        embed.set_author(name=str(user), icon_url=user.display_avatar.url if user.display_avatar else None)
-        
-        embed.add_field(name="User", value=self.format_user(user), inline=True)
+        if not await self._should_log(guild, 'member_unban'):
+            return
+        now = datetime.utcnow()
+        fields = [("User", self.format_user(user), True)]
         
-        entry = await self.get_audit_entry(guild, discord.AuditLogAction.unban, user.id)
+        entry = await self.get_audit_entry(guild, discord.AuditLogAction.unban, user.id, now=now)
         if entry:
-            embed.add_field(name="Unbanned By", value=self.format_user(entry.user), inline=True)
+            fields.append(("Unbanned By", self.format_user(entry.user), True))
             if entry.reason:
-                embed.add_field(name="Reason", value=entry.reason[:200], inline=False)
+                fields.append(("Reason", entry.reason[:200], False))
         
-        embed.set_footer(text=f"User ID: {user.id}")
-        await self.send_log(guild, 'member_unban', embed)
+        await self._emit(guild, 'member_unban', fields,
+                         author=user, now=now, footer=f"User ID: {user.id}")
     
     # ==================== ROLE EVENTS ====================
     
     @commands.Cog.listener()
     async def on_guild_role_create(self, role):
-        embed = self.make_embed("✨ Role Created", self.COLORS['role_create'])
-        embed.add_field(name="Role", value=f"{role.mention} (`{role.id}`)", inline=True)
-        embed.add_field(name="Color", value=f"`{str(role.color)}`", inline=True)
-        embed.add_field(name="Position", value=str(role.position), inline=True)
+        if not await self._should_log(role.guild, 'role_create'):
+            return
+        now = datetime.utcnow()
+        fields = [
+            ("Role", f"{role.mention} (`{role.id}`)", True),
+            ("Color", f"`{str(role.color)}`", True),
+            ("Position", str(role.position), True),
+        ]
         
-        entry = await self.get_audit_entry(role.guild, discord.AuditLogAction.role_create, role.id)
+        entry = await self.get_audit_entry(role.guild, discord.AuditLogAction.role_create, role.id, now=now)
         if entry:
-            embed.add_field(name="Created By", value=self.format_user(entry.user), inline=True)
+            fields.append(("Created By", self.format_user(entry.user), True))
         
-        embed.set_footer(text=f"Role ID: {role.id}")
-        await self.send_log(role.guild, 'role_create', embed)
+        await self._emit(role.guild, 'role_create', fields, now=now, footer=f"Role ID: {role.id}")
     
     @commands.Cog.listener()
     async def on_guild_role_delete(self, role):
-        embed = self.make_embed("🗑️ Role Deleted", self.COLORS['role_delete'])
-        embed.add_field(name="Role", value=f"`{role.name}` (`{role.id}`)", inline=True)
-        embed.add_field(name="Color", value=f"`{str(role.color)}`", inline=True)
-        embed.add_field(name="Members", value=str(len(role.members)), inline=True)
+        if not await self._should_log(role.guild, 'role_delete'):
+            return
+        now = datetime.utcnow()
+        fields = [
+            ("Role", f"`{role.name}` (`{role.id}`)", True),
+            ("Color", f"`{str(role.color)}`", True),
+            ("Members", str(len(role.members)), True),
+        ]
         
-        entry = await self.get_audit_entry(role.guild, discord.AuditLogAction.role_delete, role.id)
+        entry = await self.get_audit_entry(role.guild, discord.AuditLogAction.role_delete, role.id, now=now)
         if entry:
-            embed.add_field(name="Deleted By", value=self.format_user(entry.user), inline=True)
+            fields.append(("Deleted By", self.format_user(entry.user), True))
         
-        embed.set_footer(text=f"Role ID: {role.id}")
-        await self.send_log(role.guild, 'role_delete', embed)
+        await self._emit(role.guild, 'role_delete', fields, now=now, footer=f"Role ID: {role.id}")
     
     @commands.Cog.listener()
     async def on_guild_role_update(self, before, after):
+        if not await self._should_log(after.guild, 'role_update'):
+            return
+        now = datetime.utcnow()
         changes = []
         
         if before.name != after.name:
@@ -713,7 +948,7 @@ class LoggingModule(commands.Cog):
         if not changes:
             return
         
-        embed = self.make_embed("⚙️ Role Updated", self.COLORS['role_update'])
+        embed = self.make_log_embed('role_update', timestamp=now)
         embed.add_field(name="Role", value=f"{after.mention} (`{after.id}`)", inline=True)
         embed.add_field(name="Changes", value="\n".join(changes[:10]), inline=False)
         
@@ -724,11 +959,11 @@ class LoggingModule(commands.Cog):
                 old_val = getattr(before.permissions, perm)
                 if old_val != val:
                     icon = "✅" if val else "❌"
-                    perm_changes.append(f"{icon} {perm.replace('_', ' ').title()}")
+                    perm_changes.append(f"{icon} {self._PERM_DISPLAY[perm]}")
             if perm_changes:
                 embed.add_field(name="Permission Changes", value="\n".join(perm_changes[:15]), inline=False)
         
-        entry = await self.get_audit_entry(after.guild, discord.AuditLogAction.role_update, after.id)
+        entry = await self.get_audit_entry(after.guild, discord.AuditLogAction.role_update, after.id, now=now)
         if entry:
             embed.add_field(name="Updated By", value=self.format_user(entry.user), inline=True)
         
@@ -739,62 +974,71 @@ class LoggingModule(commands.Cog):
     
     @commands.Cog.listener()
     async def on_guild_channel_create(self, channel):
-        embed = self.make_embed("📁 Channel Created", self.COLORS['channel_create'])
-        
-        channel_type = str(channel.type).replace('_', ' ').title()
-        embed.add_field(name="Channel", value=f"{channel.mention} (`{channel.id}`)", inline=True)
-        embed.add_field(name="Type", value=channel_type, inline=True)
+        if not await self._should_log(channel.guild, 'channel_create'):
+            return
+        now = datetime.utcnow()
+        fields = [
+            ("Channel", f"{channel.mention} (`{channel.id}`)", True),
+            ("Type", str(channel.type).replace('_', ' ').title(), True),
+        ]
         
         if hasattr(channel, 'category') and channel.category:
-            embed.add_field(name="Category", value=channel.category.name, inline=True)
+            fields.append(("Category", channel.category.name, True))
         
-        entry = await self.get_audit_entry(channel.guild, discord.AuditLogAction.channel_create, channel.id)
+        entry = await self.get_audit_entry(channel.guild, discord.AuditLogAction.channel_create, channel.id, now=now)
         if entry:
-            embed.add_field(name="Created By", value=self.format_user(entry.user), inline=True)
+            fields.append(("Created By", self.format_user(entry.user), True))
         
-        embed.set_footer(text=f"Channel ID: {channel.id}")
-        await self.send_log(channel.guild, 'channel_create', embed)
+        await self._emit(channel.guild, 'channel_create', fields, now=now, footer=f"Channel ID: {channel.id}")
     
     @commands.Cog.listener()
     async def on_guild_channel_delete(self, channel):
-        embed = self.make_embed("🗑️ Channel Deleted", self.COLORS['channel_delete'])
-        
-        channel_type = str(channel.type).replace('_', ' ').title()
-        embed.add_field(name="Channel", value=f"`#{channel.name}` (`{channel.id}`)", inline=True)
-        embed.add_field(name="Type", value=channel_type, inline=True)
+        if not await self._should_log(channel.guild, 'channel_delete'):
+            return
+        now = datetime.utcnow()
+        fields = [
+            ("Channel", f"`#{channel.name}` (`{channel.id}`)", True),
+            ("Type", str(channel.type).replace('_', ' ').title(), True),
+        ]
         
         if hasattr(channel, 'category') and channel.category:
-            embed.add_field(name="Category", value=channel.category.name, inline=True)
+            fields.append(("Category", channel.category.name, True))
         
-        entry = await self.get_audit_entry(channel.guild, discord.AuditLogAction.channel_delete, channel.id)
+        entry = await self.get_audit_entry(channel.guild, discord.AuditLogAction.channel_delete, channel.id, now=now)
         if entry:
-            embed.add_field(name="Deleted By", value=self.format_user(entry.user), inline=True)
+            fields.append(("Deleted By", self.format_user(entry.user), True))
         
-        embed.set_footer(text=f"Channel ID: {channel.id}")
-        await self.send_log(channel.guild, 'channel_delete', embed)
+        await self._emit(channel.guild, 'channel_delete', fields, now=now, footer=f"Channel ID: {channel.id}")
     
     @commands.Cog.listener()
     async def on_guild_channel_update(self, before, after):
+        log_update = await self._should_log(after.guild, 'channel_update')
+        log_perms = await self._should_log(after.guild, 'channel_perms')
+        if not log_update and not log_perms:
+            return
+        now = datetime.utcnow()
         changes = []
         perm_changes = []
         
-        if before.name != after.name:
-            changes.append(f"**Name:** `{before.name}` → `{after.name}`")
-        
-        if hasattr(before, 'topic') and before.topic != after.topic:
-            changes.append(f"**Topic:** Changed")
-        
-        if hasattr(before, 'slowmode_delay') and before.slowmode_delay != after.slowmode_delay:
-            changes.append(f"**Slowmode:** `{before.slowmode_delay}s` → `{after.slowmode_delay}s`")
-        
-        if hasattr(before, 'nsfw') and before.nsfw != after.nsfw:
-            changes.append(f"**NSFW:** `{before.nsfw}` → `{after.nsfw}`")
-        
-        if before.position != after.position:
-            changes.append(f"**Position:** `{before.position}` → `{after.position}`")
+        # Each half only runs when its log type is switched on
+        if log_update:
+            if before.name != after.name:
+                changes.append(f"**Name:** `{before.name}` → `{after.name}`")
+            
+            if hasattr(before, 'topic') and before.topic != after.topic:
+                changes.append(f"**Topic:** Changed")
+            
+            if hasattr(before, 'slowmode_delay') and before.slowmode_delay != after.slowmode_delay:
+                changes.append(f"**Slowmode:** `{before.slowmode_delay}s` → `{after.slowmode_delay}s`")
+            
+            if hasattr(before, 'nsfw') and before.nsfw != after.nsfw:
+                changes.append(f"**NSFW:** `{before.nsfw}` → `{after.nsfw}`")
+            
+            if before.position != after.position:
+                changes.append(f"**Position:** `{before.position}` → `{after.position}`")
         
         # Check permission overwrites - show ALL permissions
-        if before.overwrites != after.overwrites:
+        if log_perms and before.overwrites != after.overwrites:
             for target, after_overwrite in after.overwrites.items():
                 before_overwrite = before.overwrites.get(target)
                 
@@ -814,9 +1058,9 @@ class LoggingModule(commands.Cog):
                     all_perms = []
                     for perm, val in after_overwrite:
                         if val is True:
-                            all_perms.append(f"✅ {perm.replace('_', ' ').title()}")
+                            all_perms.append(f"✅ {self._PERM_DISPLAY[perm]}")
                         elif val is False:
-                            all_perms.append(f"❌ {perm.replace('_', ' ').title()}")
+                            all_perms.append(f"❌ {self._PERM_DISPLAY[perm]}")
                     
                     if all_perms:
                         perm_changes.append({
@@ -830,7 +1074,7 @@ class LoggingModule(commands.Cog):
                     for perm, val in after_overwrite:
                         old_val = getattr(before_overwrite, perm, None) if before_overwrite else None
                         if old_val != val:
-                            perm_name = perm.replace('_', ' ').title()
+                            perm_name = self._PERM_DISPLAY[perm]
                             if val is True:
                                 all_perms.append(f"✅ {perm_name}")
                             elif val is False:
@@ -866,15 +1110,9 @@ class LoggingModule(commands.Cog):
         if not changes and not perm_changes:
             return
         
-        embed = self.make_embed("⚙️ Channel Updated", self.COLORS['channel_update'])
-        embed.add_field(name="Channel", value=f"{after.mention}", inline=True)
-        
-        if changes:
-            embed.add_field(name="Changes", value="\n".join(changes[:8]), inline=False)
-        
-        if perm_changes:
+        if log_perms and perm_changes:
             # Send permission changes in channel_perms log type
-            perm_embed = self.make_embed("🔐 Permission Update", self.COLORS['channel_perms'])
+            perm_embed = self.make_log_embed('channel_perms', timestamp=now)
             
             # Format channel - mention already includes # for text channels
             perm_embed.add_field(name="Channel", value=after.mention, inline=False)
@@ -892,17 +1130,21 @@ class LoggingModule(commands.Cog):
                 # Put target in VALUE (mentions render in values, not names)
                 perm_embed.add_field(name="Changes", value=f"{target}\n{perm_text}", inline=False)
             
-            entry = await self.get_audit_entry(after.guild, discord.AuditLogAction.overwrite_update, after.id)
+            entry = await self.get_audit_entry(after.guild, discord.AuditLogAction.overwrite_update, after.id, now=now)
             if not entry:
-                entry = await self.get_audit_entry(after.guild, discord.AuditLogAction.overwrite_create, after.id)
+                entry = await self.get_audit_entry(after.guild, discord.AuditLogAction.overwrite_create, after.id, now=now)
             if entry:
                 perm_embed.add_field(name="Updated By", value=self.format_user(entry.user), inline=True)
             
             perm_embed.set_footer(text=f"Channel ID: {after.id}")
             await self.send_log(after.guild, 'channel_perms', perm_embed)
         
-        if changes:
-            entry = await self.get_audit_entry(after.guild, discord.AuditLogAction.channel_update, after.id)
+        if log_update and changes:
+            embed = self.make_log_embed('channel_update', timestamp=now)
+            embed.add_field(name="Channel", value=f"{after.mention}", inline=True)
+            embed.add_field(name="Changes", value="\n".join(changes[:8]), inline=False)
+            
+            entry = await self.get_audit_entry(after.guild, discord.AuditLogAction.channel_update, after.id, now=now)
             if entry:
                 embed.add_field(name="Updated By", value=self.format_user(entry.user), inline=True)
             
@@ -914,57 +1156,57 @@ class LoggingModule(commands.Cog):
     @commands.Cog.listener()
     async def on_voice_state_update(self, member, before, after):
         guild = member.guild
+        user = self.format_user(member)
+        footer = f"User ID: {member.id}"
         
         # Join
         if before.channel is None and after.channel is not None:
-            embed = self.make_embed("🔊 Voice Join", self.COLORS['voice_join'])
-            embed.set_author(name=str(member), icon_url=member.display_avatar.url if member.display_avatar else None)
-            embed.add_field(name="User", value=self.format_user(member), inline=True)
-            embed.add_field(name="Channel", value=after.channel.mention, inline=True)
-            embed.set_footer(text=f"User ID: {member.id}")
-            await self.send_log(guild, 'voice_join', embed)
+            if await self._should_log(guild, 'voice_join'):
+                await self._emit(guild, 'voice_join', (
+                    ("User", user, True),
+                    ("Channel", after.channel.mention, True),
+                ), author=member, footer=footer)
         
         # Leave
         elif before.channel is not None and after.channel is None:
-            embed = self.make_embed("🔇 Voice Leave", self.COLORS['voice_leave'])
-            embed.set_author(name=str(member), icon_url=member.display_avatar.url if member.display_avatar else None)
-            embed.add_field(name="User", value=self.format_user(member), inline=True)
-            embed.add_field(name="Channel", value=before.channel.mention, inline=True)
-            embed.set_footer(text=f"User ID: {member.id}")
-            await self.send_log(guild, 'voice_leave', embed)
+            if await self._should_log(guild, 'voice_leave'):
+                await self._emit(guild, 'voice_leave', (
+                    ("User", user, True),
+                    ("Channel", before.channel.mention, True),
+                ), author=member, footer=footer)
         
         # Move
         elif before.channel != after.channel and before.channel and after.channel:
-            embed = self.make_embed("🔀 Voice Move", self.COLORS['voice_move'])
-            embed.set_author(name=str(member), icon_url=member.display_avatar.url if member.display_avatar else None)
-            embed.add_field(name="User", value=self.format_user(member), inline=True)
-            embed.add_field(name="From", value=before.channel.mention, inline=True)
-            embed.add_field(name="To", value=after.channel.mention, inline=True)
-            embed.set_footer(text=f"User ID: {member.id}")
-            await self.send_log(guild, 'voice_move', embed)
+            if await self._should_log(guild, 'voice_move'):
+                await self._emit(guild, 'voice_move', (
+                    ("User", user, True),
+                    ("From", before.channel.mention, True),
+                    ("To", after.channel.mention, True),
+                ), author=member, footer=footer)
         
         # Mute/Unmute
-        if before.self_mute != after.self_mute or before.mute != after.mute:
+        if (before.self_mute != after.self_mute or before.mute != after.mute) and await self._should_log(guild, 'voice_mute'):
             is_muted = after.self_mute or after.mute
-            embed = self.make_embed(f"🔇 {'Muted' if is_muted else 'Unmuted'}", self.COLORS['voice_mute'])
-            embed.add_field(name="User", value=self.format_user(member), inline=True)
-            embed.add_field(name="Type", value="Server Mute" if after.mute else "Self Mute", inline=True)
-            embed.set_footer(text=f"User ID: {member.id}")
-            await self.send_log(guild, 'voice_mute', embed)
+            await self._emit(guild, 'voice_mute', title=f"🔇 {'Muted' if is_muted else 'Unmuted'}", fields=(
+                ("User", user, True),
+                ("Type", "Server Mute" if after.mute else "Self Mute", True),
+            ), footer=footer)
         
         # Deafen
-        if before.self_deaf != after.self_deaf or before.deaf != after.deaf:
+        if (before.self_deaf != after.self_deaf or before.deaf != after.deaf) and await self._should_log(guild, 'voice_deafen'):
             is_deaf = after.self_deaf or after.deaf
-            embed = self.make_embed(f"🔕 {'Deafened' if is_deaf else 'Undeafened'}", self.COLORS['voice_deafen'])
-            embed.add_field(name="User", value=self.format_user(member), inline=True)
-            embed.add_field(name="Type", value="Server Deaf" if after.deaf else "Self Deaf", inline=True)
-            embed.set_footer(text=f"User ID: {member.id}")
-            await self.send_log(guild, 'voice_deafen', embed)
+            await self._emit(guild, 'voice_deafen', title=f"🔕 {'Deafened' if is_deaf else 'Undeafened'}", fields=(
+                ("User", user, True),
+                ("Type", "Server Deaf" if after.deaf else "Self Deaf", True),
+            ), footer=footer)
     
     # ==================== SERVER EVENTS ====================
     
     @commands.Cog.listener()
     async def on_guild_update(self, before, after):
+        if not await self._should_log(after, 'guild_update'):
+            return
+        now = datetime.utcnow()
         changes = []
         
         if before.name != after.name:
@@ -985,10 +1227,10 @@ class LoggingModule(commands.Cog):
         if not changes:
             return
         
-        embed = self.make_embed("⚙️ Server Updated", self.COLORS['guild_update'])
+        embed = self.make_log_embed('guild_update', timestamp=now)
         embed.add_field(name="Changes", value="\n".join(changes[:10]), inline=False)
         
-        entry = await self.get_audit_entry(after, discord.AuditLogAction.guild_update)
+        entry = await self.get_audit_entry(after, discord.AuditLogAction.guild_update, now=now)
         if entry:
             embed.add_field(name="Updated By", value=self.format_user(entry.user), inline=True)
         
@@ -997,140 +1239,151 @@ class LoggingModule(commands.Cog):
     
     @commands.Cog.listener()
     async def on_guild_emojis_update(self, guild, before, after):
+        if not await self._should_log(guild, 'emoji_update'):
+            return
+        now = datetime.utcnow()
         added = [e for e in after if e not in before]
         removed = [e for e in before if e not in after]
         
         if added:
-            embed = self.make_embed("😀 Emoji Added", self.COLORS['emoji_update'])
+            embed = self.make_embed("😀 Emoji Added", self.COLORS['emoji_update'], timestamp=now)
             for emoji in added[:5]:
                 embed.add_field(name=emoji.name, value=str(emoji), inline=True)
-            entry = await self.get_audit_entry(guild, discord.AuditLogAction.emoji_create)
+            entry = await self.get_audit_entry(guild, discord.AuditLogAction.emoji_create, now=now)
             if entry:
                 embed.add_field(name="Added By", value=self.format_user(entry.user), inline=True)
             await self.send_log(guild, 'emoji_update', embed)
         
         if removed:
-            embed = self.make_embed("😢 Emoji Removed", self.COLORS['emoji_update'])
+            embed = self.make_embed("😢 Emoji Removed", self.COLORS['emoji_update'], timestamp=now)
             embed.add_field(name="Removed", value=", ".join(f"`{e.name}`" for e in removed[:10]), inline=False)
-            entry = await self.get_audit_entry(guild, discord.AuditLogAction.emoji_delete)
+            entry = await self.get_audit_entry(guild, discord.AuditLogAction.emoji_delete, now=now)
             if entry:
                 embed.add_field(name="Removed By", value=self.format_user(entry.user), inline=True)
             await self.send_log(guild, 'emoji_update', embed)
     
     @commands.Cog.listener()
     async def on_invite_create(self, invite):
-        embed = self.make_embed("🔗 Invite Created", self.COLORS['invite_create'])
-        embed.add_field(name="Code", value=f"`{invite.code}`", inline=True)
-        embed.add_field(name="Channel", value=invite.channel.mention if invite.channel else "Unknown", inline=True)
-        embed.add_field(name="Created By", value=self.format_user(invite.inviter) if invite.inviter else "Unknown", inline=True)
+        if not invite.guild or not await self._should_log(invite.guild, 'invite_create'):
+            return
+        now = datetime.utcnow()
+        fields = [
+            ("Code", f"`{invite.code}`", True),
+            ("Channel", invite.channel.mention if invite.channel else "Unknown", True),
+            ("Created By", self.format_user(invite.inviter) if invite.inviter else "Unknown", True),
+        ]
         
         if invite.max_uses:
-            embed.add_field(name="Max Uses", value=str(invite.max_uses), inline=True)
+            fields.append(("Max Uses", str(invite.max_uses), True))
         if invite.max_age:
-            embed.add_field(name="Expires", value=f"<t:{int((datetime.utcnow() + timedelta(seconds=invite.max_age)).timestamp())}:R>", inline=True)
+            fields.append(("Expires", f"<t:{int((now + timedelta(seconds=invite.max_age)).timestamp())}:R>", True))
         
-        embed.set_footer(text=f"Invite: {invite.code}")
-        await self.send_log(invite.guild, 'invite_create', embed)
+        await self._emit(invite.guild, 'invite_create', fields, now=now, footer=f"Invite: {invite.code}")
     
     @commands.Cog.listener()
     async def on_invite_delete(self, invite):
-        embed = self.make_embed("🗑️ Invite Deleted", self.COLORS['invite_delete'])
-        embed.add_field(name="Code", value=f"`{invite.code}`", inline=True)
-        embed.add_field(name="Channel", value=invite.channel.mention if invite.channel else "Unknown", inline=True)
+        if not invite.guild or not await self._should_log(invite.guild, 'invite_delete'):
+            return
+        now = datetime.utcnow()
+        fields = [
+            ("Code", f"`{invite.code}`", True),
+            ("Channel", invite.channel.mention if invite.channel else "Unknown", True),
+        ]
         
-        entry = await self.get_audit_entry(invite.guild, discord.AuditLogAction.invite_delete)
+        entry = await self.get_audit_entry(invite.guild, discord.AuditLogAction.invite_delete, now=now)
         if entry:
-            embed.add_field(name="Deleted By", value=self.format_user(entry.user), inline=True)
+            fields.append(("Deleted By", self.format_user(entry.user), True))
         
-        embed.set_footer(text=f"Invite: {invite.code}")
-        await self.send_log(invite.guild, 'invite_delete', embed)
+        await self._emit(invite.guild, 'invite_delete', fields, now=now, footer=f"Invite: {invite.code}")
     
     # ==================== MODERATION LOG METHODS ====================
     
     async def log_warn(self, guild, user, moderator, reason: str, case_num: int, total: int = 1):
-        if not self.is_log_type_enabled(guild.id, 'mod_warn'):
+        if not await self._log_enabled(guild.id, 'mod_warn'):
             return
-        embed = self.make_embed("⚠️ Warning Issued", self.COLORS['mod_warn'])
-        embed.set_thumbnail(url=user.display_avatar.url if user.display_avatar else None)
-        embed.add_field(name="User", value=self.format_user(user), inline=True)
-        embed.add_field(name="Moderator", value=self.format_user(moderator), inline=True)
-        embed.add_field(name="Case", value=f"`#{case_num}`", inline=True)
-        embed.add_field(name="Warnings", value=f"`{total}`", inline=True)
-        embed.add_field(name="Reason", value=f"```\n{reason[:500] if reason else 'No reason'}\n```", inline=False)
-        embed.set_footer(text=f"Case #{case_num} • User: {user.id}")
-        await self.send_log(guild, 'mod_warn', embed)
+        fields = (
+            ("User", self.format_user(user), True),
+            ("Moderator", self.format_user(moderator), True),
+            ("Case", f"`#{case_num}`", True),
+            ("Warnings", f"`{total}`", True),
+            ("Reason", f"```\n{reason[:500] if reason else 'No reason'}\n```", False),
+        )
+        await self._emit(guild, 'mod_warn', fields, thumbnail=user,
+                         footer=f"Case #{case_num} • User: {user.id}")
     
     async def log_ban(self, guild, user, moderator, reason: str, case_num: int, duration: str = None):
-        if not self.is_log_type_enabled(guild.id, 'mod_ban'):
+        if not await self._log_enabled(guild.id, 'mod_ban'):
             return
-        embed = self.make_embed("🔨 User Banned", self.COLORS['mod_ban'])
-        embed.set_thumbnail(url=user.display_avatar.url if user.display_avatar else None)
-        embed.add_field(name="User", value=self.format_user(user), inline=True)
-        embed.add_field(name="Moderator", value=self.format_user(moderator), inline=True)
-        embed.add_field(name="Case", value=f"`#{case_num}`", inline=True)
-        embed.add_field(name="Duration", value=f"`{duration or 'Permanent'}`", inline=True)
-        embed.add_field(name="Reason", value=f"```\n{reason[:500] if reason else 'No reason'}\n```", inline=False)
-        embed.set_footer(text=f"Case #{case_num} • User: {user.id}")
-        await self.send_log(guild, 'mod_ban', embed)
+        fields = (
+            ("User", self.format_user(user), True),
+            ("Moderator", self.format_user(moderator), True),
+            ("Case", f"`#{case_num}`", True),
+            ("Duration", f"`{duration or 'Permanent'}`", True),
+            ("Reason", f"```\n{reason[:500] if reason else 'No reason'}\n```", False),
+        )
+        await self._emit(guild, 'mod_ban', fields, thumbnail=user,
+                         footer=f"Case #{case_num} • User: {user.id}")
     
     async def log_kick(self, guild, user, moderator, reason: str, case_num: int):
-        if not self.is_log_type_enabled(guild.id, 'mod_kick'):
+        if not await self._log_enabled(guild.id, 'mod_kick'):
             return
-        embed = self.make_embed("👢 User Kicked", self.COLORS['mod_kick'])
-        embed.set_thumbnail(url=user.display_avatar.url if user.display_avatar else None)
-        embed.add_field(name="User", value=self.format_user(user), inline=True)
-        embed.add_field(name="Moderator", value=self.format_user(moderator), inline=True)
-        embed.add_field(name="Case", value=f"`#{case_num}`", inline=True)
-        embed.add_field(name="Reason", value=f"```\n{reason[:500] if reason else 'No reason'}\n```", inline=False)
-        embed.set_footer(text=f"Case #{case_num} • User: {user.id}")
-        await self.send_log(guild, 'mod_kick', embed)
+        fields = (
+            ("User", self.format_user(user), True),
+            ("Moderator", self.format_user(moderator), True),
+            ("Case", f"`#{case_num}`", True),
+            ("Reason", f"```\n{reason[:500] if reason else 'No reason'}\n```", False),
+        )
+        await self._emit(guild, 'mod_kick', fields, thumbnail=user,
+                         footer=f"Case #{case_num} • User: {user.id}")
     
     async def log_mute(self, guild, user, moderator, reason: str, case_num: int, duration: str = None):
-        if not self.is_log_type_enabled(guild.id, 'mod_mute'):
+        if not await self._log_enabled(guild.id, 'mod_mute'):
             return
-        embed = self.make_embed("🔇 User Muted", self.COLORS['mod_mute'])
-        embed.set_thumbnail(url=user.display_avatar.url if user.display_avatar else None)
-        embed.add_field(name="User", value=self.format_user(user), inline=True)
-        embed.add_field(name="Moderator", value=self.format_user(moderator), inline=True)
-        embed.add_field(name="Case", value=f"`#{case_num}`", inline=True)
+        fields = [
+            ("User", self.format_user(user), True),
+            ("Moderator", self.format_user(moderator), True),
+            ("Case", f"`#{case_num}`", True),
+        ]
         if duration:
-            embed.add_field(name="Duration", value=f"`{duration}`", inline=True)
-        embed.add_field(name="Reason", value=f"```\n{reason[:500] if reason else 'No reason'}\n```", inline=False)
-        embed.set_footer(text=f"Case #{case_num} • User: {user.id}")
-        await self.send_log(guild, 'mod_mute', embed)
+            fields.append(("Duration", f"`{duration}`", True))
+        fields.append(("Reason", f"```\n{reason[:500] if reason else 'No reason'}\n```", False))
+        await self._emit(guild, 'mod_mute', fields, thumbnail=user,
+                         footer=f"Case #{case_num} • User: {user.id}")
     
     async def log_unban(self, guild, user, moderator, reason: str, case_num: int):
-        if not self.is_log_type_enabled(guild.id, 'mod_unban'):
+        if not await self._log_enabled(guild.id, 'mod_unban'):
             return
-        embed = self.make_embed("🔓 User Unbanned", self.COLORS['mod_unban'])
-        embed.set_thumbnail(url=user.display_avatar.url if user.display_avatar else None)
-        embed.add_field(name="User", value=self.format_user(user), inline=True)
-        embed.add_field(name="Moderator", value=self.format_user(moderator), inline=True)
-        embed.add_field(name="Case", value=f"`#{case_num}`", inline=True)
-        embed.add_field(name="Reason", value=f"```\n{reason[:500] if reason else 'No reason'}\n```", inline=False)
-        embed.set_footer(text=f"Case #{case_num} • User: {user.id}")
-        await self.send_log(guild, 'mod_unban', embed)
+        fields = (
+            ("User", self.format_user(user), True),
+            ("Moderator", self.format_user(moderator), True),
+            ("Case", f"`#{case_num}`", True),
+            ("Reason", f"```\n{reason[:500] if reason else 'No reason'}\n```", False),
+        )
+        await self._emit(guild, 'mod_unban', fields, thumbnail=user,
+                         footer=f"Case #{case_num} • User: {user.id}")
     
     async def log_unwarn(self, guild, user, moderator, case_num: int, original_case: int):
-        if not self.is_log_type_enabled(guild.id, 'mod_unwarn'):
+        if not await self._log_enabled(guild.id, 'mod_unwarn'):
             return
-        embed = self.make_embed("📝 Warning Cleared", self.COLORS['mod_unwarn'])
-        embed.set_thumbnail(url=user.display_avatar.url if user.display_avatar else None)
-        embed.add_field(name="User", value=self.format_user(user), inline=True)
-        embed.add_field(name="Moderator", value=self.format_user(moderator), inline=True)
-        embed.add_field(name="Original Case", value=f"`#{original_case}`", inline=True)
-        embed.set_footer(text=f"User: {user.id}")
-        await self.send_log(guild, 'mod_unwarn', embed)
+        fields = (
+            ("User", self.format_user(user), True),
+            ("Moderator", self.format_user(moderator), True),
+            ("Original Case", f"`#{original_case}`", True),
+        )
+        await self._emit(guild, 'mod_unwarn', fields, thumbnail=user,
+                         footer=f"User: {user.id}")
     
     async def log_purge(self, ctx, count: int, target_user, filter_type: str, messages: List):
-        if not self.is_log_type_enabled(ctx.guild.id, 'mod_purge'):
+        if not await self._log_enabled(ctx.guild.id, 'mod_purge'):
             return
+        now = datetime.utcnow()
         
-        case_num = self.create_case(ctx.guild.id, 'purge', target_user.id if target_user else 0,
-                                     str(target_user) if target_user else "All", ctx.author.id, str(ctx.author),
-                                     f"Purged {count} messages", {'filter': filter_type})
+        case_num = await asyncio.to_thread(
+            self.create_case, ctx.guild.id, 'purge', target_user.id if target_user else 0,
+            str(target_user) if target_user else "All", ctx.author.id, str(ctx.author),
+            f"Purged {count} messages", {'filter': filter_type})
         
-        embed = self.make_embed("🗑️ Messages Purged", self.COLORS['mod_purge'])
+        embed = self.make_log_embed('mod_purge', timestamp=now)
         embed.add_field(name="Moderator", value=self.format_user(ctx.author), inline=True)
         embed.add_field(name="Channel", value=ctx.channel.mention, inline=True)
         embed.add_field(name="Count", value=f"`{count}`", inline=True)
@@ -1140,11 +1393,11 @@ class LoggingModule(commands.Cog):
         
         # Create log file
         if messages:
-            log = f"Purge Log - {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}\n\n"
-            for msg in sorted(messages, key=lambda m: m.created_at):
-                log += f"[{msg.created_at.strftime('%H:%M:%S')}] {msg.author}: {msg.content or '[no content]'}\n"
+            parts = [f"Purge Log - {now.strftime('%Y-%m-%d %H:%M:%S UTC')}", ""]
+            parts.extend(f"[{msg.created_at.strftime('%H:%M:%S')}] {msg.author}: {msg.content or '[no content]'}"
+                         for msg in sorted(messages, key=lambda m: m.created_at))
+            log = "\n".join(parts) + "\n"
             
-            import io
             file = discord.File(io.BytesIO(log.encode()), filename=f"purge_{case_num}.txt")
             embed.set_footer(text=f"Case #{case_num}")
             await self.send_log(ctx.guild, 'mod_purge', embed, file)
@@ -1156,19 +1409,16 @@ class LoggingModule(commands.Cog):
     
     async def log_bfos_action(self, guild, action_type: str, user, description: str, details: dict = None):
         log_type = f"bfos_{action_type}"
-        if not self.is_log_type_enabled(guild.id, log_type):
+        if not await self._log_enabled(guild.id, log_type):
             return
         
-        embed = self.make_embed(f"🤖 BFOS: {action_type.title()}", self.COLORS.get(log_type, 0x00AAFF), description)
-        embed.set_author(name=str(user), icon_url=user.display_avatar.url if user.display_avatar else None)
-        embed.add_field(name="Executed By", value=self.format_user(user), inline=True)
-        
+        fields = [("Executed By", self.format_user(user), True)]
         if details:
-            for k, v in list(details.items())[:5]:
-                embed.add_field(name=k, value=f"`{str(v)[:100]}`", inline=True)
+            fields.extend((str(k), f"`{str(v)[:100]}`", True) for k, v in list(details.items())[:5])
         
-        embed.set_footer(text=f"BFOS • User: {user.id}")
-        await self.send_log(guild, log_type, embed)
+        await self._emit(guild, log_type, fields, title=f"🤖 BFOS: {action_type.title()}",
+                         color=self.COLORS.get(log_type, 0x00AAFF), description=description,
+                         author=user, footer=f"BFOS • User: {user.id}")
 
 
 async def setup(bot):
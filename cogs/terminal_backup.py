@@ -419,7 +419,7 @@ class BackupPanel:
         if not self.backup_system:
             return f"{ANSIColors.RED}❌ Backup system not available.{ANSIColors.RESET}"
         
-        success = self.backup_system.delete_backup(self.guild.id, backup_id)
+        success = await self.backup_system.delete_backup(self.guild.id, backup_id)
         
         if success:
             return f"{ANSIColors.GREEN}✓{ANSIColors.RESET} Backup {ANSIColors.BRIGHT_WHITE}{backup_id}{ANSIColors.RESET} deleted successfully."
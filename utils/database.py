@@ -8,6 +8,41 @@ import json
 import os
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _backup_loads(raw):
+    """Parse stored backup JSON - backups can be several MB, so prefer orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _backup_dumps(data):
+    """Serialize backup data for storage, as str so the column stays TEXT"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data)
+
+
+# Bumped whenever a permission is granted or revoked so in-memory permission caches can tell they are stale
+_permission_generation = 0
+
+
+def permission_generation():
+    """Current permission-assignment generation - changes after every successful grant or revoke"""
+    return _permission_generation
+
+
+def _bump_permission_generation():
+    global _permission_generation
+    _permission_generation += 1
+
+
 class Database:
     """SQLite database handler for BFOS"""
     
@@ -1796,7 +1831,6 @@ class Database:
         conn = self._get_connection()
         cursor = conn.cursor()
         
-        import json
         from datetime import datetime
         import uuid
         
@@ -1805,7 +1839,7 @@ class Database:
         cursor.execute('''
             INSERT INTO backups (backup_id, guild_id, backup_name, backup_data, created_at, locked)
             VALUES (?, ?, ?, ?, ?, ?)
-        ''', (backup_id, guild_id, backup_name, json.dumps(backup_data), datetime.utcnow().isoformat(), 0))
+        ''', (backup_id, guild_id, backup_name, _backup_dumps(backup_data), datetime.utcnow().isoformat(), 0))
         
         conn.commit()
         conn.close()
@@ -1839,8 +1873,6 @@ class Database:
         conn = self._get_connection()
         cursor = conn.cursor()
         
-        import json
-        
         cursor.execute('''
             SELECT backup_id, backup_name, backup_data, created_at, locked
             FROM backups
@@ -1854,7 +1886,7 @@ class Database:
             return {
                 'id': row[0],
                 'name': row[1],
-                'data': json.loads(row[2]),
+                'data': _backup_loads(row[2]),
                 'created_at': row[3],
                 'locked': bool(row[4])
             }
@@ -2051,7 +2083,7 @@ class Database:
                 SET backup_name = ?, backup_data = ?, file_size_bytes = ?,
                     roles_count = ?, channels_count = ?, emojis_count = ?, stickers_count = ?
                 WHERE backup_id = ?
-            ''', (backup_name, json.dumps(backup_data), file_size, roles_count, 
+            ''', (backup_name, _backup_dumps(backup_data), file_size, roles_count, 
                   channels_count, emojis_count, stickers_count, backup_id))
         else:
             cursor.execute('''
@@ -2059,7 +2091,7 @@ class Database:
                 (backup_id, guild_id, backup_name, backup_data, file_size_bytes,
                  roles_count, channels_count, emojis_count, stickers_count, imported_from, created_at)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (backup_id, guild_id, backup_name, json.dumps(backup_data), file_size,
+            ''', (backup_id, guild_id, backup_name, _backup_dumps(backup_data), file_size,
                   roles_count, channels_count, emojis_count, stickers_count, imported_from,
                   datetime.utcnow()))
         
@@ -2081,7 +2113,7 @@ class Database:
         conn.close()
         
         if row:
-            return json.loads(row[0])
+            return _backup_loads(row[0])
         return None
     
     def find_backup_by_id(self, backup_id):
@@ -2098,7 +2130,7 @@ class Database:
         conn.close()
         
         if row:
-            return json.loads(row[0])
+            return _backup_loads(row[0])
         return None
     
     def list_comprehensive_backups(self, guild_id):
@@ -2395,6 +2427,8 @@ class Database:
             success = False  # Already exists
         
         conn.close()
+        if success:
+            _bump_permission_generation()
         return success
     
     def remove_permission(self, guild_id, permission_id, user_id=None, role_id=None):
@@ -2412,6 +2446,8 @@ class Database:
         success = cursor.rowcount > 0
         conn.commit()
         conn.close()
+        if success:
+            _bump_permission_generation()
         return success
     
     def has_permission(self, guild_id, user_id, permission_id):
@@ -2442,6 +2478,24 @@ class Database:
         conn.close()
         return has_perm
     
+    def has_any_permission(self, guild_id, user_id, role_ids, permission_id):
+        """Check if a user has a permission directly or through any of role_ids, in one query"""
+        role_ids = list(role_ids)
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        role_marks = ','.join('?' * len(role_ids))
+        cursor.execute(f'''
+            SELECT 1 FROM permission_assignments
+            WHERE guild_id = ? AND permission_id = ?
+            AND (user_id = ? OR role_id IN ({role_marks}))
+            LIMIT 1
+        ''', (guild_id, permission_id, user_id, *role_ids))
+        
+        has_perm = cursor.fetchone() is not None
+        conn.close()
+        return has_perm
+    
     def get_user_permissions(self, guild_id, user_id):
         """Get all permissions for a user"""
         conn = self._get_connection()
@@ -2470,6 +2524,24 @@ class Database:
         conn.close()
         return perms
     
+    def get_roles_permissions(self, guild_id, role_ids):
+        """Get the union of permissions granted to any of role_ids"""
+        role_ids = list(role_ids)
+        if not role_ids:
+            return []
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        role_marks = ','.join('?' * len(role_ids))
+        cursor.execute(f'''
+            SELECT DISTINCT permission_id FROM permission_assignments
+            WHERE guild_id = ? AND role_id IN ({role_marks})
+        ''', (guild_id, *role_ids))
+        
+        perms = [row[0] for row in cursor.fetchall()]
+        conn.close()
+        return perms
+    
     def get_all_permissions(self, guild_id):
         """Get all permission assignments for a guild"""
         conn = self._get_connection()